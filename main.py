@@ -18,6 +18,9 @@ from datetime import datetime, time as dt_time
 from typing import Dict
 from zoneinfo import ZoneInfo
 
+# Parse YAML with libyaml when PyYAML was built with it (same results, much faster)
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Try to import colorama for proper Windows color support
 try:
     import colorama
@@ -157,7 +160,7 @@ class SwingTradingBot:
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file"""
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
     
     def _setup_logging(self):
         """Setup logging configuration"""
@@ -1213,6 +1216,8 @@ Available commands:
             self.logger.warning("Strategy manager not available")
             return
 
+        # An explicit /discover always rescans the directory
+        self.strategy_manager.invalidate_caches()
         new_strategies = self.strategy_manager.get_unloaded_strategies()
 
         if not new_strategies:
@@ -9,7 +9,7 @@ Example usage:
     from strategies import StrategyManager, SwingTradingStrategy
 
     # Load via manager (recommended)
-    manager = StrategyManager(config)
+    manager = StrategyManager(config)   # or StrategyManager.from_yaml('config.yaml')
     manager.load_all_configured()
     signal = manager.get_best_signal(ticker, current_price)
 
@@ -28,16 +28,34 @@ Example usage:
     signal = strategy.analyze(ticker, current_price)
 """
 
-from .base_strategy import BaseStrategy, StrategySignal, TradeDirection
+import importlib
+
+from .base_strategy import BaseStrategy, StrategySignal, TradeDirection, register_strategy
 from .strategy_manager import StrategyManager
-from .swing_trading import SwingTradingStrategy
-from .scalping import ScalpingStrategy
-from .vix_momentum_orb import VIXMomentumORB
+
+# Concrete strategies are imported on first access, so importing the package
+# (e.g. for StrategyManager) doesn't pull in every strategy module. The manager
+# imports the ones that are actually configured when it loads them.
+_LAZY_EXPORTS = {
+    'SwingTradingStrategy': '.swing_trading',
+    'ScalpingStrategy': '.scalping',
+    'VIXMomentumORB': '.vix_momentum_orb',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'BaseStrategy',
     'StrategySignal',
     'TradeDirection',
+    'register_strategy',
     'StrategyManager',
     'SwingTradingStrategy',
     'ScalpingStrategy',
@@ -0,0 +1,61 @@
+"""
+Numeric kernels for ScalpingStrategy.
+
+Like _swing_kernels, the kernels are plain loops that run as ordinary Python
+and are compiled by Numba when it is installed. The explicit signature makes
+Numba compile at import (i.e. at bot startup, not on the first live tick), and
+cache=True reuses the compiled code on later restarts.
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Book depth used to warm up the compiled kernel
+WARMUP_DEPTH = 10
+
+
+def book_imbalance(bid_prices, bid_sizes, ask_prices, ask_sizes):
+    """
+    Order book imbalance: (bid volume - ask volume) / total volume.
+
+    Levels with a non-positive price are ignored. Returns NaN when there
+    is no volume on either side.
+    """
+    total_bid = 0.0
+    for i in range(len(bid_prices)):
+        if bid_prices[i] > 0:
+            total_bid += bid_sizes[i]
+
+    total_ask = 0.0
+    for i in range(len(ask_prices)):
+        if ask_prices[i] > 0:
+            total_ask += ask_sizes[i]
+
+    total = total_bid + total_ask
+    if total == 0:
+        return float('nan')
+    return (total_bid - total_ask) / total
+
+
+if NUMBA_AVAILABLE:
+    book_imbalance = njit('float64(float64[:], float64[:], float64[:], float64[:])',
+                          cache=True)(book_imbalance)
+
+
+def warm_up():
+    """Run the kernels once on a dummy book so the first live tick is not the first call."""
+    if not NUMBA_AVAILABLE:
+        return
+    prices = np.ones(WARMUP_DEPTH, dtype=np.float64)
+    sizes = np.ones(WARMUP_DEPTH, dtype=np.float64)
+    book_imbalance(prices, sizes, prices, sizes)
@@ -0,0 +1,186 @@
+"""
+Numeric kernels for SwingTradingStrategy.
+
+The kernels are plain loops over indexable sequences so they run unchanged
+as ordinary Python. When Numba is installed they are compiled with explicit
+signatures and cache=True, which moves compilation to import time and reuses
+the compiled code across restarts. Compiled kernels expect NumPy arrays.
+"""
+
+import math
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Book depth used to warm up the compiled kernels
+WARMUP_DEPTH = 10
+
+
+def swing_scan(highs, lows, half_window, out):
+    """
+    Flag swing points in a bar series.
+
+    Sets out[i] to 1 for a swing high (high strictly above every other high
+    within half_window bars on either side), -1 for a swing low (low strictly
+    below every other low in the window), and leaves it untouched otherwise.
+    A bar that is a swing high is not also tested as a swing low.
+
+    Window extremes come from monotonic index queues, so the scan is O(n)
+    whatever the window size. Each side keeps two queues: one where a new
+    bar evicts equal values (its front is the latest index of the window
+    extreme) and one where it doesn't (front is the earliest). The middle
+    bar is a strict extreme exactly when both fronts point at it.
+
+    Args:
+        highs: Bar highs
+        lows: Bar lows
+        half_window: Bars to compare on each side
+        out: Zero-initialized flags, same length as highs
+    """
+    n = len(highs)
+    window = 2 * half_window + 1
+    if n < window:
+        return
+
+    # Queues are slices [head, tail) of index arrays; each bar is pushed once
+    high_last = [0] * n
+    high_first = [0] * n
+    low_last = [0] * n
+    low_first = [0] * n
+    hl_head = hl_tail = hf_head = hf_tail = 0
+    ll_head = ll_tail = lf_head = lf_tail = 0
+
+    for j in range(n):
+        high = highs[j]
+        while hl_tail > hl_head and highs[high_last[hl_tail - 1]] <= high:
+            hl_tail -= 1
+        high_last[hl_tail] = j
+        hl_tail += 1
+        while hf_tail > hf_head and highs[high_first[hf_tail - 1]] < high:
+            hf_tail -= 1
+        high_first[hf_tail] = j
+        hf_tail += 1
+
+        low = lows[j]
+        while ll_tail > ll_head and lows[low_last[ll_tail - 1]] >= low:
+            ll_tail -= 1
+        low_last[ll_tail] = j
+        ll_tail += 1
+        while lf_tail > lf_head and lows[low_first[lf_tail - 1]] > low:
+            lf_tail -= 1
+        low_first[lf_tail] = j
+        lf_tail += 1
+
+        # Drop indices that have left the window [j - window + 1, j]
+        start = j - window + 1
+        if high_last[hl_head] < start:
+            hl_head += 1
+        if high_first[hf_head] < start:
+            hf_head += 1
+        if low_last[ll_head] < start:
+            ll_head += 1
+        if low_first[lf_head] < start:
+            lf_head += 1
+
+        if start < 0:
+            continue
+
+        i = j - half_window
+        if high_last[hl_head] == i and high_first[hf_head] == i:
+            out[i] = 1
+        elif low_last[ll_head] == i and low_first[lf_head] == i:
+            out[i] = -1
+
+
+if NUMBA_AVAILABLE:
+    swing_scan = njit('void(float64[:], float64[:], int64, int8[:])', cache=True)(swing_scan)
+
+
+def zscore_scan(prices, volumes, current_price, exclusion_pct, zscore_threshold,
+                half_window, liquidity_threshold, out_index, out_zscore):
+    """
+    Find significant liquidity levels by local volume Z-score.
+
+    A level qualifies when its volume is at least liquidity_threshold, it is
+    outside the exclusion zone (|current_price - price| > current_price *
+    exclusion_pct) and its Z-score against the levels within half_window on
+    either side (itself included) is at least zscore_threshold. The Z-score
+    uses the sample standard deviation and is 0.0 for windows of fewer than
+    2 levels or zero spread. Window sums are kept as a running sum and sum of
+    squares, so the scan is O(n).
+
+    Args:
+        prices: Level prices, ascending
+        volumes: Volume at each level
+        current_price: Current price (centre of the exclusion zone)
+        exclusion_pct: Exclusion zone as a fraction of current_price
+        zscore_threshold: Minimum Z-score
+        half_window: Levels to compare on each side
+        liquidity_threshold: Minimum volume
+        out_index: Receives the indices of qualifying levels, in price order
+        out_zscore: Receives their Z-scores
+
+    Returns:
+        Number of qualifying levels written to the out arrays
+    """
+    n = len(volumes)
+    exclusion_distance = current_price * exclusion_pct
+    total = 0.0
+    total_sq = 0.0
+    lo = 0
+    hi = 0
+    count = 0
+    for i in range(n):
+        # Slide the window to [i - half_window, i + half_window]
+        while hi < n and hi <= i + half_window:
+            total += volumes[hi]
+            total_sq += volumes[hi] * volumes[hi]
+            hi += 1
+        while lo < i - half_window:
+            total -= volumes[lo]
+            total_sq -= volumes[lo] * volumes[lo]
+            lo += 1
+
+        size = volumes[i]
+        if size < liquidity_threshold:
+            continue
+        if abs(current_price - prices[i]) <= exclusion_distance:
+            continue
+
+        window = hi - lo
+        spread = window * total_sq - total * total
+        if window < 2 or spread <= 0:
+            zscore = 0.0
+        else:
+            zscore = (size - total / window) / math.sqrt(spread / (window * (window - 1)))
+
+        if zscore >= zscore_threshold:
+            out_index[count] = i
+            out_zscore[count] = zscore
+            count += 1
+    return count
+
+
+if NUMBA_AVAILABLE:
+    zscore_scan = njit('int64(float64[:], float64[:], float64, float64, float64, int64, float64, '
+                       'int64[:], float64[:])', cache=True)(zscore_scan)
+
+
+def warm_up():
+    """Run the kernels once on a dummy book so the first live tick is not the first call."""
+    if not NUMBA_AVAILABLE:
+        return
+    prices = np.arange(WARMUP_DEPTH, dtype=np.float64)
+    volumes = np.ones(WARMUP_DEPTH, dtype=np.float64)
+    zscore_scan(prices, volumes, 0.0, 0.0, 0.0, WARMUP_DEPTH // 2, 0.0,
+                np.empty(WARMUP_DEPTH, dtype=np.int64), np.empty(WARMUP_DEPTH, dtype=np.float64))
@@ -7,7 +7,7 @@ the required abstract methods.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Sequence, Type
 from enum import Enum
 from datetime import datetime, timedelta
 import statistics
@@ -27,7 +27,7 @@ class TradeDirection(Enum):
     IRON_CONDOR = "iron_condor"
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategySignal:
     """
     Signal output from a strategy.
@@ -169,6 +169,25 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def analyze_batch(self, tickers: Sequence[Any], prices: Sequence[float],
+                      contexts: Sequence[Optional[Dict[str, Any]]]) -> List[Optional[StrategySignal]]:
+        """
+        Analyze several symbols in one call.
+
+        The default calls analyze() for each (ticker, price, context) triple.
+        Strategies that can share work across symbols override this.
+
+        Args:
+            tickers: Tickers to analyze (entries may be None)
+            prices: Current price for each ticker
+            contexts: Context dict for each ticker
+
+        Returns:
+            One entry per input: the signal, or None
+        """
+        return [self.analyze(ticker, price, context)
+                for ticker, price, context in zip(tickers, prices, contexts)]
+
     def get_config(self, key: str, default: Any = None, symbol: Optional[str] = None) -> Any:
         """Get a configuration parameter, optionally checking symbol-specific overrides."""
         if symbol:
@@ -180,6 +199,15 @@ class BaseStrategy(ABC):
     def set_config(self, key: str, value: Any):
         """Set a configuration parameter."""
         self._config[key] = value
+        self.on_config_change(key)
+
+    def on_config_change(self, key: str):
+        """
+        Called after set_config() changes a parameter.
+
+        Override to drop anything derived from the configuration (e.g.
+        settings cached between ticks). The default does nothing.
+        """
 
     @property
     def config(self) -> Dict[str, Any]:
@@ -527,3 +555,25 @@ class BaseStrategy(ABC):
         modifier = self._calculate_performance_modifier(strategy_name)
         adjusted = confidence * modifier
         return max(0.0, min(1.0, adjusted))
+
+
+# Strategy type name -> class, populated by @register_strategy at import time.
+_STRATEGY_REGISTRY: Dict[str, Type[BaseStrategy]] = {}
+
+
+def register_strategy(name: str) -> Callable[[Type[BaseStrategy]], Type[BaseStrategy]]:
+    """
+    Class decorator that registers a strategy under its type name.
+
+    The name should match the plugin file name (without .py) so the
+    StrategyManager can find the class directly after importing the file.
+
+    Example:
+        @register_strategy('my_strategy')
+        class MyStrategy(BaseStrategy):
+            ...
+    """
+    def decorator(cls: Type[BaseStrategy]) -> Type[BaseStrategy]:
+        _STRATEGY_REGISTRY[name] = cls
+        return cls
+    return decorator
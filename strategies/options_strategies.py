@@ -5,14 +5,21 @@ Implements Spread and Iron Condor strategies based on Market Regime.
 """
 
 import logging
+from collections import ChainMap
 from typing import Dict, Optional, Any
-from .base_strategy import StrategySignal, TradeDirection
+from .base_strategy import StrategySignal, TradeDirection, register_strategy
 from .swing_trading import SwingTradingStrategy, Pattern
 from market_context import MarketRegime
 
 logger = logging.getLogger(__name__)
 
+# Regime gating runs on every tick. MarketRegime members are singletons,
+# so the checks below compare by identity against these module constants.
+_UNKNOWN_REGIME = MarketRegime.UNKNOWN
+_LONG_PUT_REGIMES = (MarketRegime.BEAR_TREND, MarketRegime.HIGH_CHAOS)
 
+
+@register_strategy('bull_put_spread')
 class BullPutSpreadStrategy(SwingTradingStrategy):
     """
     Bull Put Spread (Credit Spread).
@@ -20,6 +27,8 @@ class BullPutSpreadStrategy(SwingTradingStrategy):
     Logic: Sell short_put_delta Put, Buy long_put_delta Put.
     Exit: 50% Max Profit.
     """
+    _required_regime = MarketRegime.BULL_TREND
+
     @property
     def name(self) -> str:
         return "bull_put_spread"
@@ -36,10 +45,10 @@ class BullPutSpreadStrategy(SwingTradingStrategy):
     def analyze(self, ticker: Any, current_price: float, context: Optional[Dict[str, Any]] = None) -> Optional[StrategySignal]:
         # 1. Check Market Regime
         context = context or {}
-        regime = context.get('market_regime', MarketRegime.UNKNOWN)
-        if regime != MarketRegime.BULL_TREND:
+        regime = context.get('market_regime') or _UNKNOWN_REGIME
+        if regime is not self._required_regime:
             instance_name = self.get_config('instance_name', self.name, symbol=context.get('symbol'))
-            logger.info(f"{instance_name} ({context.get('symbol')}): Skipping - Regime {regime.value} != {MarketRegime.BULL_TREND.value}")
+            logger.info(f"{instance_name} ({context.get('symbol')}): Skipping - Regime {regime.value} != {self._required_regime.value}")
             return None
 
         # 2. Use Swing Strategy logic to detect Support Rejection
@@ -57,11 +66,11 @@ class BullPutSpreadStrategy(SwingTradingStrategy):
                 confidence=signal.confidence,
                 pattern_name=signal.pattern_name,
                 price_level=signal.price_level,
-                metadata={
-                    **signal.metadata,
+                # Layer option-specific keys over the swing metadata without copying it
+                metadata=ChainMap({
                     'legs': {'short_delta': short_delta, 'long_delta': long_delta, 'type': 'put'},
                     'exit_rule': f'{int(exit_pct * 100)}_pct_profit'
-                }
+                }, signal.metadata)
             )
         return None
 
@@ -80,12 +89,15 @@ class BullPutSpreadStrategy(SwingTradingStrategy):
             }
         ]
 
+@register_strategy('bear_put_spread')
 class BearPutSpreadStrategy(SwingTradingStrategy):
     """
     Bear Put Spread (Debit Spread).
     Entry: Support Imbalance Breakthrough (Breakout Down) AND Bear Trend.
     Logic: Buy long_put_delta Put, Sell short_put_delta Put.
     """
+    _required_regime = MarketRegime.BEAR_TREND
+
     @property
     def name(self) -> str:
         return "bear_put_spread"
@@ -101,10 +113,10 @@ class BearPutSpreadStrategy(SwingTradingStrategy):
     def analyze(self, ticker: Any, current_price: float, context: Optional[Dict[str, Any]] = None) -> Optional[StrategySignal]:
         # 1. Check Market Regime
         context = context or {}
-        regime = context.get('market_regime', MarketRegime.UNKNOWN)
-        if regime != MarketRegime.BEAR_TREND:
+        regime = context.get('market_regime') or _UNKNOWN_REGIME
+        if regime is not self._required_regime:
             instance_name = self.get_config('instance_name', self.name, symbol=context.get('symbol'))
-            logger.info(f"{instance_name} ({context.get('symbol')}): Skipping - Regime {regime.value} != {MarketRegime.BEAR_TREND.value}")
+            logger.info(f"{instance_name} ({context.get('symbol')}): Skipping - Regime {regime.value} != {self._required_regime.value}")
             return None
 
         # 2. Detect Breakout Down (Absorption/Breakout)
@@ -122,10 +134,9 @@ class BearPutSpreadStrategy(SwingTradingStrategy):
                     confidence=signal.confidence,
                     pattern_name=signal.pattern_name,
                     price_level=signal.price_level,
-                    metadata={
-                        **signal.metadata,
+                    metadata=ChainMap({
                         'legs': {'long_delta': long_delta, 'short_delta': short_delta, 'type': 'put'}
-                    }
+                    }, signal.metadata)
                 )
         return None
 
@@ -133,6 +144,7 @@ class BearPutSpreadStrategy(SwingTradingStrategy):
     def get_test_scenarios(cls) -> list:
         return []
 
+@register_strategy('long_put')
 class LongPutStrategy(SwingTradingStrategy):
     """
     Long Put.
@@ -157,8 +169,8 @@ class LongPutStrategy(SwingTradingStrategy):
     def analyze(self, ticker: Any, current_price: float, context: Optional[Dict[str, Any]] = None) -> Optional[StrategySignal]:
         # 1. Check Market Regime
         context = context or {}
-        regime = context.get('market_regime', MarketRegime.UNKNOWN)
-        if regime not in [MarketRegime.BEAR_TREND, MarketRegime.HIGH_CHAOS]:
+        regime = context.get('market_regime') or _UNKNOWN_REGIME
+        if regime not in _LONG_PUT_REGIMES:
             instance_name = self.get_config('instance_name', self.name, symbol=context.get('symbol'))
             logger.info(f"{instance_name} ({context.get('symbol')}): Skipping - Regime {regime.value} not in [bear_trend, high_chaos]")
             return None
@@ -189,10 +201,9 @@ class LongPutStrategy(SwingTradingStrategy):
                         confidence=signal.confidence,
                         pattern_name=signal.pattern_name,
                         price_level=signal.price_level,
-                        metadata={
-                            **signal.metadata,
+                        metadata=ChainMap({
                             'legs': {'long_delta': put_delta, 'type': 'put'}
-                        }
+                        }, signal.metadata)
                     )
         return None
 
@@ -200,6 +211,7 @@ class LongPutStrategy(SwingTradingStrategy):
     def get_test_scenarios(cls) -> list:
         return []
 
+@register_strategy('iron_condor')
 class IronCondorStrategy(SwingTradingStrategy):
     """
     Iron Condor.
@@ -207,6 +219,8 @@ class IronCondorStrategy(SwingTradingStrategy):
     Logic: Sell short deltas, Buy wing deltas.
     Exit: Configurable % profit or DTE threshold.
     """
+    _required_regime = MarketRegime.RANGE_BOUND
+
     @property
     def name(self) -> str:
         return "iron_condor"
@@ -227,18 +241,21 @@ class IronCondorStrategy(SwingTradingStrategy):
     def analyze(self, ticker: Any, current_price: float, context: Optional[Dict[str, Any]] = None) -> Optional[StrategySignal]:
         # 1. Check Market Regime
         context = context or {}
-        regime = context.get('market_regime', MarketRegime.UNKNOWN)
-        if regime != MarketRegime.RANGE_BOUND:
+        regime = context.get('market_regime') or _UNKNOWN_REGIME
+        if regime is not self._required_regime:
             instance_name = self.get_config('instance_name', self.name, symbol=context.get('symbol'))
-            logger.info(f"{instance_name} ({context.get('symbol')}): Skipping - Regime {regime.value} != {MarketRegime.RANGE_BOUND.value}")
+            logger.info(f"{instance_name} ({context.get('symbol')}): Skipping - Regime {regime.value} != {self._required_regime.value}")
             return None
 
-        # 2. Get analysis from parent
-        analysis = self.get_analysis(ticker, current_price, context.get('symbol'))
+        # 2. Get the strongest confirmed zones from the parent's level tracking
+        #    (only these are needed, so skip get_analysis() and its book scan)
+        symbol = context.get('symbol')
+        confirmed_support = self._get_confirmed_levels(symbol, 'support')
+        confirmed_resistance = self._get_confirmed_levels(symbol, 'resistance')
 
         # Check if price is roughly in middle of nearest zones
-        nearest_support = analysis['confirmed_support'][0]['price'] if analysis['confirmed_support'] else 0
-        nearest_resistance = analysis['confirmed_resistance'][0]['price'] if analysis['confirmed_resistance'] else float('inf')
+        nearest_support = confirmed_support[0].price if confirmed_support else 0
+        nearest_resistance = confirmed_resistance[0].price if confirmed_resistance else float('inf')
 
         if nearest_support > 0 and nearest_resistance < float('inf'):
             midpoint = (nearest_support + nearest_resistance) / 2
@@ -247,7 +264,6 @@ class IronCondorStrategy(SwingTradingStrategy):
             # If price is in the middle 50% of the range
             dist_to_mid = abs(current_price - midpoint)
             if dist_to_mid < (range_width * 0.25):
-                symbol = context.get('symbol')
                 sp_delta = self.get_config('short_put_delta', 15, symbol=symbol)
                 lp_delta = self.get_config('long_put_delta', 5, symbol=symbol)
                 sc_delta = self.get_config('short_call_delta', 15, symbol=symbol)
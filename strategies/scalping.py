@@ -13,26 +13,31 @@ Separated from Swing Trading which focuses on support/resistance levels.
 """
 
 import logging
-from typing import Dict, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 
-from .base_strategy import BaseStrategy, StrategySignal, TradeDirection
+from .base_strategy import BaseStrategy, StrategySignal, TradeDirection, register_strategy
+from ._scalping_kernels import NUMBA_AVAILABLE, NUMPY_AVAILABLE, book_imbalance, np, warm_up
 
 logger = logging.getLogger(__name__)
 
+# Marks an imbalance that analyze() still has to compute itself
+_NOT_COMPUTED = object()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ScalpPosition:
     """Track a scalping position for time-decay exit logic."""
     symbol: str
     direction: TradeDirection
     entry_price: float
-    entry_time: datetime
+    entry_time_ns: int              # time.monotonic_ns() at entry, for diagnostics
     entry_tick: int
     initial_imbalance: float
 
 
+@register_strategy('scalping')
 class ScalpingStrategy(BaseStrategy):
     """
     Scalping strategy based on order book imbalance.
@@ -53,6 +58,12 @@ class ScalpingStrategy(BaseStrategy):
         self._tick_counts: Dict[str, int] = {}  # symbol -> tick count
         self._entry_prices: Dict[str, float] = {}  # symbol -> entry price for decay check
 
+        # Reusable entry signals, one per (symbol, direction). See _pooled_signal().
+        self._signal_pool: Dict[Tuple[str, TradeDirection], StrategySignal] = {}
+
+        # Exercise the compiled imbalance kernel before live ticks arrive
+        warm_up()
+
     @property
     def name(self) -> str:
         return "scalping"
@@ -111,8 +122,26 @@ class ScalpingStrategy(BaseStrategy):
             context: Optional context with 'symbol' key
 
         Returns:
-            StrategySignal if opportunity detected, None otherwise
+            StrategySignal if opportunity detected, None otherwise.
+            Entry signals are reused per symbol/direction, so they are only
+            valid until the next analyze() call for the same symbol.
+        """
+        return self._analyze(ticker, current_price, context, _NOT_COMPUTED)
+
+    def analyze_batch(self, tickers: Sequence[Any], prices: Sequence[float],
+                      contexts: Sequence[Optional[Dict[str, Any]]]) -> List[Optional[StrategySignal]]:
+        """
+        Analyze a batch of symbols, computing all book imbalances up front.
+
+        Per-symbol entry/exit logic is unchanged from analyze().
         """
+        imbalances = self._calculate_imbalances(tickers)
+        return [self._analyze(ticker, price, context, imbalance)
+                for ticker, price, context, imbalance in zip(tickers, prices, contexts, imbalances)]
+
+    def _analyze(self, ticker: Any, current_price: float,
+                 context: Optional[Dict[str, Any]], imbalance: Any) -> Optional[StrategySignal]:
+        """analyze() body; imbalance is precomputed by analyze_batch() or _NOT_COMPUTED."""
         context = context or {}
         symbol = context.get('symbol', 'UNKNOWN')
 
@@ -135,7 +164,8 @@ class ScalpingStrategy(BaseStrategy):
         tick = self._tick_counts[symbol]
 
         # Calculate order book imbalance
-        imbalance = self._calculate_imbalance(ticker)
+        if imbalance is _NOT_COMPUTED:
+            imbalance = self._calculate_imbalance(ticker)
 
         if imbalance is None:
             return None
@@ -170,21 +200,16 @@ class ScalpingStrategy(BaseStrategy):
                     f"imbalance: {imbalance:+.2f}, confidence: {confidence:.2f}"
                 )
 
-                metadata = {
-                    'imbalance': imbalance,
-                    'tick': tick,
-                    'strategy_type': 'scalping'
-                }
+                signal = self._pooled_signal(symbol, TradeDirection.LONG_CALL, "imbalance_long", confidence)
+                metadata = signal.metadata
+                metadata['imbalance'] = imbalance
+                metadata['tick'] = tick
+                metadata['strategy_type'] = 'scalping'
                 if abs(confidence - raw_confidence) > 0.001:
                     metadata['raw_confidence'] = raw_confidence
                     metadata['performance_adjusted'] = True
 
-                return StrategySignal(
-                    direction=TradeDirection.LONG_CALL,
-                    confidence=confidence,
-                    pattern_name="imbalance_long",
-                    metadata=metadata
-                )
+                return signal
 
         # Strong sell imbalance
         elif imbalance <= -entry_threshold:
@@ -203,21 +228,16 @@ class ScalpingStrategy(BaseStrategy):
                     f"imbalance: {imbalance:+.2f}, confidence: {confidence:.2f}"
                 )
 
-                metadata = {
-                    'imbalance': imbalance,
-                    'tick': tick,
-                    'strategy_type': 'scalping'
-                }
+                signal = self._pooled_signal(symbol, TradeDirection.LONG_PUT, "imbalance_short", confidence)
+                metadata = signal.metadata
+                metadata['imbalance'] = imbalance
+                metadata['tick'] = tick
+                metadata['strategy_type'] = 'scalping'
                 if abs(confidence - raw_confidence) > 0.001:
                     metadata['raw_confidence'] = raw_confidence
                     metadata['performance_adjusted'] = True
 
-                return StrategySignal(
-                    direction=TradeDirection.LONG_PUT,
-                    confidence=confidence,
-                    pattern_name="imbalance_short",
-                    metadata=metadata
-                )
+                return signal
         
         # Log status when no signal
         else:
@@ -243,6 +263,77 @@ class ScalpingStrategy(BaseStrategy):
 
         return (total_bid - total_ask) / total
 
+    def _calculate_imbalances(self, tickers: Sequence[Any]) -> List[Optional[float]]:
+        """
+        Calculate order book imbalance for many tickers at once.
+
+        With NumPy, all books are flattened into shared price/size arrays. The
+        compiled book_imbalance kernel then runs on each book's slice, or,
+        without Numba, the sizes are summed per book with np.add.reduceat.
+        Results match _calculate_imbalance().
+        """
+        if not NUMPY_AVAILABLE:
+            return [self._calculate_imbalance(t) if t is not None else None for t in tickers]
+
+        books = [i for i, t in enumerate(tickers) if t is not None and t.domBids and t.domAsks]
+        imbalances: List[Optional[float]] = [None] * len(tickers)
+        if not books:
+            return imbalances
+
+        bid_counts = [len(tickers[i].domBids) for i in books]
+        ask_counts = [len(tickers[i].domAsks) for i in books]
+
+        if NUMBA_AVAILABLE:
+            bid_prices = np.fromiter((b.price for i in books for b in tickers[i].domBids), dtype=np.float64)
+            bid_sizes = np.fromiter((b.size for i in books for b in tickers[i].domBids), dtype=np.float64)
+            ask_prices = np.fromiter((a.price for i in books for a in tickers[i].domAsks), dtype=np.float64)
+            ask_sizes = np.fromiter((a.size for i in books for a in tickers[i].domAsks), dtype=np.float64)
+            bid_start = ask_start = 0
+            for i, bid_count, ask_count in zip(books, bid_counts, ask_counts):
+                bid_end = bid_start + bid_count
+                ask_end = ask_start + ask_count
+                imbalance = book_imbalance(bid_prices[bid_start:bid_end], bid_sizes[bid_start:bid_end],
+                                           ask_prices[ask_start:ask_end], ask_sizes[ask_start:ask_end])
+                if imbalance == imbalance:  # NaN means an empty book
+                    imbalances[i] = imbalance
+                bid_start, ask_start = bid_end, ask_end
+            return imbalances
+
+        bid_sizes = np.fromiter((b.size if b.price > 0 else 0 for i in books for b in tickers[i].domBids),
+                                dtype=np.float64)
+        ask_sizes = np.fromiter((a.size if a.price > 0 else 0 for i in books for a in tickers[i].domAsks),
+                                dtype=np.float64)
+        bid_starts = np.cumsum([0] + bid_counts[:-1])
+        ask_starts = np.cumsum([0] + ask_counts[:-1])
+        total_bid = np.add.reduceat(bid_sizes, bid_starts)
+        total_ask = np.add.reduceat(ask_sizes, ask_starts)
+        total = total_bid + total_ask
+
+        for i, bid, ask, tot in zip(books, total_bid.tolist(), total_ask.tolist(), total.tolist()):
+            if tot != 0:
+                imbalances[i] = (bid - ask) / tot
+        return imbalances
+
+    def _pooled_signal(self, symbol: str, direction: TradeDirection,
+                       pattern_name: str, confidence: float) -> StrategySignal:
+        """
+        Get the reusable entry signal for symbol/direction, reset for a new emission.
+
+        Avoids allocating a StrategySignal and metadata dict on every entry tick.
+        The returned object is overwritten the next time the same signal fires
+        for this symbol, so callers must not hold on to it across ticks.
+        """
+        key = (symbol, direction)
+        signal = self._signal_pool.get(key)
+        if signal is None:
+            signal = StrategySignal(direction=direction, confidence=confidence,
+                                    pattern_name=pattern_name)
+            self._signal_pool[key] = signal
+        else:
+            signal.confidence = confidence
+            signal.metadata.clear()
+        return signal
+
     def _start_tracking(self, symbol: str, direction: TradeDirection,
                         price: float, tick: int, imbalance: float):
         """Start tracking a position for time-decay logic."""
@@ -250,7 +341,7 @@ class ScalpingStrategy(BaseStrategy):
             symbol=symbol,
             direction=direction,
             entry_price=price,
-            entry_time=datetime.now(),
+            entry_time_ns=time.monotonic_ns(),
             entry_tick=tick,
             initial_imbalance=imbalance
         )
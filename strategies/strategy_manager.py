@@ -5,21 +5,146 @@ Handles loading, configuring, and orchestrating trading strategies.
 Supports dynamic plugin loading from the strategies directory.
 """
 
+import functools
 import importlib
+import importlib.machinery
 import importlib.util
+import inspect
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Type, Set
+from types import MappingProxyType, ModuleType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Any, Sequence, Type, Set, Tuple
 
-from .base_strategy import BaseStrategy, StrategySignal
+from .base_strategy import BaseStrategy, StrategySignal, _STRATEGY_REGISTRY
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only context handed to strategies when the caller passes none
+_EMPTY_CTX: Mapping[str, Any] = MappingProxyType({})
+
+# Directory scanned for strategy plugin files (this package)
+_STRATEGIES_DIR = Path(__file__).parent
+
+# Above this many enabled strategies analyze_all() uses the generic loop
+# instead of a generated dispatcher (the generated code grows linearly)
+_MAX_INLINE_DISPATCH = 32
+
 # Files that should not be treated as standalone strategy types.
 # options_strategies.py contains multiple classes registered individually in BUILTIN_STRATEGIES.
-EXCLUDED_FILES = {'__init__.py', 'base_strategy.py', 'strategy_manager.py', 'template_strategy.py',
-                  'options_strategies.py'}
+# _swing_kernels.py and _scalping_kernels.py hold numeric helpers used by those strategies.
+EXCLUDED_FILES = frozenset({'__init__.py', 'base_strategy.py', 'strategy_manager.py', 'template_strategy.py',
+                            'options_strategies.py', '_swing_kernels.py', '_scalping_kernels.py'})
+
+# Same exclusions by module name, plus 'template'. Discovery also skips any
+# underscore-prefixed (private) module.
+_EXCLUDED_STEMS = frozenset(f.removesuffix('.py') for f in EXCLUDED_FILES) | {'template'}
+
+
+def _cached_import(module_path: str, class_name: str) -> Any:
+    """
+    Get class_name from module_path, importing the module only if needed.
+
+    Checks sys.modules first so loading an already-imported strategy skips
+    the import machinery (and its lock). A module that is still initializing
+    goes through import_module so we never return a half-executed module.
+    """
+    modules = sys.modules
+    module = modules.get(module_path)
+    if (module is None
+            or getattr(module, '__spec__', None) is None
+            or getattr(module.__spec__, '_initializing', False) is True):
+        importlib.import_module(module_path)
+        module = modules[module_path]
+    return getattr(module, class_name)
+
+
+class _InstanceRecord:
+    """Bookkeeping for one loaded strategy instance, kept together in a single record."""
+
+    __slots__ = ('name', 'strategy', 'type', 'source', 'enabled', 'symbols', 'mtime')
+
+    def __init__(self, name: str, strategy: BaseStrategy, strategy_type: str, source: str,
+                 enabled: bool, symbols: Optional[frozenset], mtime: Optional[int]):
+        self.name = name
+        self.strategy = strategy
+        self.type = strategy_type        # strategy type, e.g. 'swing_trading'
+        self.source = source             # 'builtin' or 'file'
+        self.enabled = enabled
+        self.symbols = symbols           # allowed symbols, or None if unrestricted
+        self.mtime = mtime               # source file mtime_ns when (re)loaded
+
+
+class _LazyStrategy:
+    """
+    Stand-in for a disabled built-in strategy whose module is not imported yet.
+
+    Answers what the bot asks of every loaded strategy (get_config, dependency
+    wiring, status) from the instance config. Any other attribute imports the
+    module, creates the real strategy once and forwards to it. The manager
+    swaps the real strategy in when the instance is enabled.
+    """
+
+    version = '-'
+    description = 'Disabled (module not imported yet)'
+
+    def __init__(self, strategy_type: str, config: Dict[str, Any],
+                 factory: Callable[[Dict[str, Any]], Optional[BaseStrategy]]):
+        self.name = strategy_type
+        self._config = config
+        self._factory = factory
+        self._strategy: Optional[BaseStrategy] = None
+        # Setter name -> value, replayed on the real strategy once it exists
+        self._deferred: Dict[str, Any] = {}
+
+    def _load(self) -> BaseStrategy:
+        """Create the real strategy on first use."""
+        strategy = self._strategy
+        if strategy is None:
+            strategy = self._factory(self._config)
+            if strategy is None:
+                raise RuntimeError(f"Failed to load strategy type '{self.name}'")
+            for method, value in self._deferred.items():
+                setter = getattr(strategy, method, None)
+                if setter is not None:
+                    setter(value)
+            self._strategy = strategy
+        return strategy
+
+    def _defer(self, method: str, value: Any):
+        if self._strategy is not None:
+            getattr(self._strategy, method)(value)
+        else:
+            self._deferred[method] = value
+
+    def set_ib_wrapper(self, wrapper: Any):
+        self._defer('set_ib_wrapper', wrapper)
+
+    def set_trade_db(self, db: Any):
+        self._defer('set_trade_db', db)
+
+    def get_config(self, key: str, default: Any = None, symbol: Optional[str] = None) -> Any:
+        """Same lookup as BaseStrategy.get_config(), on the config the strategy will receive."""
+        if self._strategy is not None:
+            return self._strategy.get_config(key, default, symbol)
+        if symbol:
+            overrides = self._config.get('symbol_overrides', {}).get(symbol, {})
+            if key in overrides:
+                return overrides[key]
+        return self._config.get(key, default)
+
+    def set_config(self, key: str, value: Any):
+        if self._strategy is not None:
+            self._strategy.set_config(key, value)
+        else:
+            self._config[key] = value
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        return f"<_LazyStrategy type='{self.name}' (not imported)>"
 
 
 class StrategyManager:
@@ -34,17 +159,23 @@ class StrategyManager:
     """
 
     # Built-in strategies that are always available
-    # Maps strategy type name -> module.ClassName
-    BUILTIN_STRATEGIES = {
-        'swing_trading': 'strategies.swing_trading.SwingTradingStrategy',
-        'scalping': 'strategies.scalping.ScalpingStrategy',
-        'vix_momentum_orb': 'strategies.vix_momentum_orb.VIXMomentumORB',
-        'bull_put_spread': 'strategies.options_strategies.BullPutSpreadStrategy',
-        'bear_put_spread': 'strategies.options_strategies.BearPutSpreadStrategy',
-        'long_put': 'strategies.options_strategies.LongPutStrategy',
-        'iron_condor': 'strategies.options_strategies.IronCondorStrategy',
+    # Maps strategy type name -> (module name, class name)
+    BUILTIN_STRATEGIES: Dict[str, Tuple[str, str]] = {
+        'swing_trading': ('strategies.swing_trading', 'SwingTradingStrategy'),
+        'scalping': ('strategies.scalping', 'ScalpingStrategy'),
+        'vix_momentum_orb': ('strategies.vix_momentum_orb', 'VIXMomentumORB'),
+        'bull_put_spread': ('strategies.options_strategies', 'BullPutSpreadStrategy'),
+        'bear_put_spread': ('strategies.options_strategies', 'BearPutSpreadStrategy'),
+        'long_put': ('strategies.options_strategies', 'LongPutStrategy'),
+        'iron_condor': ('strategies.options_strategies', 'IronCondorStrategy'),
     }
 
+    # Imported strategy files, keyed by (resolved path, mtime_ns).
+    # Stores the module and its discovered strategy class so repeated loads
+    # (multiple instances, reloads of an unchanged file) skip exec_module and
+    # the class scan. Shared across managers since it mirrors files on disk.
+    _module_cache: Dict[Tuple[str, int], Tuple[ModuleType, Type[BaseStrategy]]] = {}
+
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize the strategy manager.
@@ -76,9 +207,56 @@ class StrategyManager:
                    }
         """
         self._config = config or {}
-        self._strategies: Dict[str, BaseStrategy] = {}  # instance_name -> strategy
-        self._enabled: Dict[str, bool] = {}
-        self._instance_types: Dict[str, str] = {}  # instance_name -> strategy_type
+        # The 'strategies' section, read once; config.yaml is not re-read at runtime
+        self._strategies_config: Dict[str, Dict[str, Any]] = self._config.get('strategies') or {}
+        self._records: Dict[str, _InstanceRecord] = {}  # instance_name -> record
+        # instance_name -> strategy, kept alongside the records for get_all_strategies()
+        self._strategies: Dict[str, BaseStrategy] = {}
+
+        # With safe mode off, analyze_all() drops per-strategy error isolation:
+        # one try/except guards the whole dispatch instead of one per strategy
+        operation = self._config.get('operation') or {}
+        self._safe_mode: bool = operation.get('strategy_safe_mode', True)
+
+        # Finds plugin modules in the strategies directory. Like importlib's own
+        # path finders it caches the directory listing until the mtime changes.
+        # Extension modules are listed first, matching the normal import order.
+        self._finder = importlib.machinery.FileFinder(
+            str(_STRATEGIES_DIR),
+            (importlib.machinery.ExtensionFileLoader, importlib.machinery.EXTENSION_SUFFIXES),
+            (importlib.machinery.SourceFileLoader, importlib.machinery.SOURCE_SUFFIXES),
+        )
+
+        # Read-only live view handed out by get_all_strategies()
+        self._strategies_view: Mapping[str, BaseStrategy] = MappingProxyType(self._strategies)
+
+        # (strategies dir mtime_ns, discovered names) from the last discover_strategies() scan
+        self._discover_cache: Optional[Tuple[int, FrozenSet[str]]] = None
+
+        # Records of enabled strategies, in load order; its length is the enabled count.
+        # Rebuilt whenever strategies are loaded, reloaded, enabled or disabled.
+        self._enabled_cache: List[_InstanceRecord] = []
+        # The enabled strategies themselves, returned as-is by get_enabled_strategies()
+        self._enabled_strategies: Tuple[BaseStrategy, ...] = ()
+        # Every loaded strategy, enabled or not, for the notify_position_*() broadcasts
+        self._all_strategies: Tuple[BaseStrategy, ...] = ()
+
+        # Specialized analyze_all() body for the enabled strategies, see _rebuild_dispatch()
+        self._dispatch = None
+        self._rebuild_enabled_cache()
+
+    @classmethod
+    def from_yaml(cls, path: str) -> 'StrategyManager':
+        """
+        Create a manager from a YAML config file (e.g. config.yaml).
+
+        Parses with libyaml's CSafeLoader when PyYAML was built with it,
+        falling back to the pure-Python SafeLoader.
+        """
+        import yaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(path, 'r') as f:
+            return cls(yaml.load(f, Loader=loader))
 
     def load_strategy(self, instance_name: str,
                       strategy_class: Optional[Type[BaseStrategy]] = None,
@@ -110,8 +288,12 @@ class StrategyManager:
             # Get strategy-specific config
             strategy_config = config or self._get_strategy_config(instance_name)
 
-            # Inject instance_name into config so strategies can use it for logging
-            strategy_config = {**strategy_config, 'instance_name': instance_name}
+            # Inject instance_name into config so strategies can use it for logging.
+            # Dicts owned by the caller or by the config tree (re-read on reload)
+            # are copied first; a fresh default dict is updated in place.
+            if strategy_config is config or instance_name in self._strategies_config:
+                strategy_config = dict(strategy_config)
+            strategy_config['instance_name'] = instance_name
 
             # Determine strategy type: explicit param > config 'type' field > instance_name
             resolved_type: str = strategy_type or strategy_config.get('type', instance_name)
@@ -119,6 +301,10 @@ class StrategyManager:
             # If class provided, use it directly
             if strategy_class is not None:
                 strategy = strategy_class(strategy_config)
+            # Built-in type, disabled: defer the import until it is enabled or used
+            elif resolved_type in self.BUILTIN_STRATEGIES and not strategy_config.get('enabled', True):
+                strategy = _LazyStrategy(resolved_type, strategy_config,
+                                         functools.partial(self._load_builtin, resolved_type))
             # Check if it's a built-in strategy type
             elif resolved_type in self.BUILTIN_STRATEGIES:
                 strategy = self._load_builtin(resolved_type, strategy_config)
@@ -130,15 +316,23 @@ class StrategyManager:
                 logger.error(f"Failed to load strategy instance '{instance_name}' (type: {resolved_type})")
                 return None
 
-            # Validate config
-            errors = strategy.validate_config()
-            if errors:
-                logger.warning(f"Strategy {instance_name} config warnings: {errors}")
+            # Validate config (deferred strategies are validated when created)
+            lazy = isinstance(strategy, _LazyStrategy)
+            if not lazy:
+                errors = strategy.validate_config()
+                if errors:
+                    logger.warning(f"Strategy {instance_name} config warnings: {errors}")
 
             # Register strategy instance
             self._strategies[instance_name] = strategy
-            self._enabled[instance_name] = strategy_config.get('enabled', True)
-            self._instance_types[instance_name] = resolved_type
+            self._records[instance_name] = _InstanceRecord(
+                instance_name, strategy, resolved_type,
+                'builtin' if resolved_type in self.BUILTIN_STRATEGIES else 'file',
+                strategy_config.get('enabled', True),
+                self._build_symbol_filter(strategy),
+                None if lazy else self._source_mtime(strategy),
+            )
+            self._rebuild_enabled_cache()
 
             logger.info(f"Loaded strategy instance '{instance_name}' (type: {resolved_type}): {strategy}")
             return strategy
@@ -152,12 +346,10 @@ class StrategyManager:
         if name not in self.BUILTIN_STRATEGIES:
             return None
 
-        module_path = self.BUILTIN_STRATEGIES[name]
-        module_name, class_name = module_path.rsplit('.', 1)
+        module_name, class_name = self.BUILTIN_STRATEGIES[name]
 
         try:
-            module = importlib.import_module(module_name)
-            strategy_class = getattr(module, class_name)
+            strategy_class = _cached_import(module_name, class_name)
             return strategy_class(config)
         except Exception as e:
             logger.error(f"Failed to load built-in strategy {name}: {e}")
@@ -165,40 +357,85 @@ class StrategyManager:
 
     def _load_from_file(self, name: str, config: Dict[str, Any]) -> Optional[BaseStrategy]:
         """Load a strategy from a Python file in the strategies directory."""
-        # Determine strategies directory
-        strategies_dir = Path(__file__).parent
-
-        # Look for matching file
-        strategy_file = strategies_dir / f"{name}.py"
-        if not strategy_file.exists():
-            logger.error(f"Strategy file not found: {strategy_file}")
+        # Register the module under the package so relative imports inside
+        # the plugin (from .base_strategy import ...) resolve.
+        module_name = f"{__package__}.{name}"
+        spec = self._finder.find_spec(module_name)
+        if spec is None:
+            logger.error(f"Strategy file not found: {_STRATEGIES_DIR / f'{name}.py'}")
             return None
+        strategy_file = Path(spec.origin)
 
         try:
-            # Load module from file
-            spec = importlib.util.spec_from_file_location(name, strategy_file)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            key = (str(strategy_file.resolve()), strategy_file.stat().st_mtime_ns)
+            cached = self._module_cache.get(key)
+            if cached is not None:
+                return cached[1](config)
 
-            # Find strategy class in module
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and
-                    issubclass(attr, BaseStrategy) and
-                    attr is not BaseStrategy):
-                    return attr(config)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except Exception:
+                sys.modules.pop(module_name, None)
+                raise
+
+            # Classes decorated with @register_strategy(name) are looked up directly,
+            # then a module-level STRATEGY_CLASS; only other plugins need a scan
+            strategy_class = _STRATEGY_REGISTRY.get(name)
+            if strategy_class is None or strategy_class.__module__ != module_name:
+                strategy_class = getattr(module, 'STRATEGY_CLASS', None)
+                if not (isinstance(strategy_class, type) and issubclass(strategy_class, BaseStrategy)):
+                    strategy_class = self._find_strategy_class(module)
+
+            if strategy_class is None:
+                logger.error(f"No BaseStrategy subclass found in {strategy_file}")
+                return None
 
-            logger.error(f"No BaseStrategy subclass found in {strategy_file}")
-            return None
+            # Drop entries for older versions of this file before caching the new one
+            self._invalidate_file_cache(key[0])
+            self._module_cache[key] = (module, strategy_class)
+            return strategy_class(config)
 
         except Exception as e:
             logger.error(f"Failed to load strategy from {strategy_file}: {e}")
             return None
 
+    @classmethod
+    def _invalidate_file_cache(cls, path: str):
+        """Forget cached imports of a strategy file (any mtime)."""
+        for key in [key for key in cls._module_cache if key[0] == path]:
+            del cls._module_cache[key]
+
+    @staticmethod
+    def _find_strategy_class(module: ModuleType) -> Optional[Type[BaseStrategy]]:
+        """
+        Scan a module for a BaseStrategy subclass (plugins without @register_strategy).
+
+        Only public names are considered (those in __all__ when the module
+        defines it), and classes defined in the module itself win over
+        strategies it merely imports, e.g. the base class of a subclassed
+        built-in strategy.
+        """
+        namespace = vars(module)
+        names = getattr(module, '__all__', None) or [n for n in namespace if not n.startswith('_')]
+        imported = None
+        for name in names:
+            attr = namespace.get(name)
+            if (isinstance(attr, type) and
+                issubclass(attr, BaseStrategy) and
+                attr is not BaseStrategy and
+                not inspect.isabstract(attr)):
+                if attr.__module__ == module.__name__:
+                    return attr
+                if imported is None:
+                    imported = attr
+        return imported
+
     def _get_strategy_config(self, name: str) -> Dict[str, Any]:
         """Get configuration for a specific strategy."""
-        strategies_config = self._config.get('strategies', {})
-        return strategies_config.get(name, {})
+        # A miss returns a fresh dict: load_strategy() may update it in place
+        return self._strategies_config.get(name, {})
 
     def load_all_configured(self) -> int:
         """
@@ -207,7 +444,7 @@ class StrategyManager:
         Returns:
             Number of strategies successfully loaded
         """
-        strategies_config = self._config.get('strategies', {})
+        strategies_config = self._strategies_config
         loaded = 0
 
         for name, config in strategies_config.items():
@@ -224,36 +461,63 @@ class StrategyManager:
 
     def enable_strategy(self, name: str):
         """Enable a loaded strategy."""
-        if name in self._strategies:
-            self._enabled[name] = True
+        record = self._records.get(name)
+        if record is not None:
+            if isinstance(record.strategy, _LazyStrategy) and not self._materialize(record):
+                return
+            record.enabled = True
+            self._rebuild_enabled_cache()
             logger.info(f"Enabled strategy: {name}")
         else:
             logger.warning(f"Strategy not loaded: {name}")
 
+    def _materialize(self, record: _InstanceRecord) -> bool:
+        """Replace a deferred strategy with the real one (imports its module)."""
+        try:
+            strategy = record.strategy._load()
+        except Exception as e:
+            logger.error(f"Error loading strategy {record.name}: {e}")
+            return False
+
+        errors = strategy.validate_config()
+        if errors:
+            logger.warning(f"Strategy {record.name} config warnings: {errors}")
+
+        self._strategies[record.name] = strategy
+        record.strategy = strategy
+        record.symbols = self._build_symbol_filter(strategy)
+        record.mtime = self._source_mtime(strategy)
+        return True
+
     def disable_strategy(self, name: str):
         """Disable a loaded strategy."""
-        if name in self._strategies:
-            self._enabled[name] = False
+        record = self._records.get(name)
+        if record is not None:
+            record.enabled = False
+            self._rebuild_enabled_cache()
             logger.info(f"Disabled strategy: {name}")
 
     def is_enabled(self, name: str) -> bool:
         """Check if a strategy is enabled."""
-        return self._enabled.get(name, False)
+        record = self._records.get(name)
+        return record is not None and record.enabled
 
     def get_strategy(self, name: str) -> Optional[BaseStrategy]:
         """Get a loaded strategy by name."""
         return self._strategies.get(name)
 
-    def get_enabled_strategies(self) -> List[BaseStrategy]:
-        """Get all enabled strategies."""
-        return [
-            strategy for name, strategy in self._strategies.items()
-            if self._enabled.get(name, False)
-        ]
+    def get_enabled_strategies(self) -> Tuple[BaseStrategy, ...]:
+        """Get all enabled strategies (an immutable tuple, rebuilt only on changes)."""
+        return self._enabled_strategies
 
-    def get_all_strategies(self) -> Dict[str, BaseStrategy]:
-        """Get all loaded strategies."""
-        return self._strategies.copy()
+    def get_all_strategies(self) -> Mapping[str, BaseStrategy]:
+        """
+        Get all loaded strategies.
+
+        Returns a read-only view that reflects later loads; copy it with
+        dict() if you need a snapshot to iterate while loading strategies.
+        """
+        return self._strategies_view
 
     def analyze_all(self, ticker: Any, current_price: float,
                     context: Optional[Dict[str, Any]] = None) -> List[StrategySignal]:
@@ -268,31 +532,193 @@ class StrategyManager:
         Returns:
             List of signals from all enabled strategies
         """
+        if context is None:
+            context = _EMPTY_CTX
+        return self._dispatch(ticker, current_price, context, context.get('symbol'))
+
+    @staticmethod
+    def _build_symbol_filter(strategy: BaseStrategy) -> Optional[frozenset]:
+        """Freeze a strategy's 'symbols' restriction into a set (None if unrestricted)."""
+        symbols = strategy.get_config('symbols')
+        if not symbols:
+            return None
+        if isinstance(symbols, str):
+            return frozenset([symbols])
+        return frozenset(symbols)
+
+    def _rebuild_enabled_cache(self):
+        """Recompute the strategy snapshots, the enabled list and the dispatcher built from it."""
+        self._all_strategies = tuple(self._strategies.values())
+        self._enabled_cache = [record for record in self._records.values() if record.enabled]
+        self._enabled_strategies = tuple(record.strategy for record in self._enabled_cache)
+        self._rebuild_dispatch()
+
+    def _rebuild_dispatch(self):
+        """
+        Generate the analyze_all() dispatcher for the currently enabled strategies.
+
+        analyze_all() runs for every symbol on every tick, while the set of
+        enabled strategies only changes on load/reload/enable/disable. So
+        instead of iterating all strategies and checking enabled flags per
+        call, build a straight-line function that calls each enabled strategy
+        in turn, with the strategy, its instance name and type bound as
+        closure variables. Behaviour matches the generic loop: symbol
+        filtering, per-strategy error isolation and metadata tagging.
+
+        With safe mode off, the strategy calls are not wrapped individually;
+        a single try/except around the whole dispatch logs the failing
+        strategy and returns no signals for that call.
+
+        Past _MAX_INLINE_DISPATCH enabled strategies one of the generic
+        loops (_analyze_loop_safe / _analyze_loop_fast) is used instead.
+        """
+        if len(self._enabled_cache) > _MAX_INLINE_DISPATCH:
+            self._dispatch = self._analyze_loop_safe if self._safe_mode else self._analyze_loop_fast
+            return
+
+        safe_mode = self._safe_mode
+        params = []
+        bindings = []
+        body = []
+        for n, record in enumerate(self._enabled_cache):
+            params += [f'_s{n}', f'_n{n}', f'_t{n}']
+            bindings += [record.strategy, record.name, record.type]
+            block = [
+                f"signal = _s{n}.analyze(ticker, current_price, context)",
+                "if signal is not None:",
+                f"    signal.metadata['strategy'] = _n{n}",
+                f"    signal.metadata['strategy_type'] = _t{n}",
+                "    signals.append(signal)",
+            ]
+            if safe_mode:
+                block = (["try:"] + ['    ' + line for line in block] +
+                         ["except Exception as e:",
+                          f"    logger.error(f'Strategy {{_n{n}}} error: {{e}}')"])
+            else:
+                block = [f"current = _n{n}"] + block
+            # Only strategies restricted to specific symbols get a filter check
+            symbol_filter = record.symbols
+            if symbol_filter is not None:
+                params.append(f'_f{n}')
+                bindings.append(symbol_filter)
+                block = [f"if not symbol or symbol in _f{n}:"] + ['    ' + line for line in block]
+            body += block
+
+        if not safe_mode and body:
+            body = (["current = None", "try:"] + ['    ' + line for line in body] +
+                    ["except Exception as e:",
+                     "    logger.error(f'Strategy {current} error: {e}')",
+                     "    return []"])
+
+        source = '\n'.join([
+            f"def _make_dispatch({', '.join(params)}):",
+            "    def _dispatch(ticker, current_price, context, symbol):",
+            "        signals = []",
+            *['        ' + line for line in body],
+            "        return signals",
+            "    return _dispatch",
+        ])
+        namespace = {'logger': logger}
+        exec(compile(source, '<strategy_dispatch>', 'exec'), namespace)
+        self._dispatch = namespace['_make_dispatch'](*bindings)
+
+    def _analyze_loop_safe(self, ticker: Any, current_price: float,
+                           context: Mapping[str, Any], symbol: Optional[str]) -> List[StrategySignal]:
+        """Generic analyze_all() dispatcher for safe mode: errors are isolated per strategy."""
         signals = []
-        context = context or {}
-        symbol = context.get('symbol')
-
-        for instance_name, strategy in self._strategies.items():
-            if not self._enabled.get(instance_name, False):
+        for record in self._enabled_cache:
+            symbol_filter = record.symbols
+            if symbol_filter is not None and symbol and symbol not in symbol_filter:
                 continue
 
-            # Check if strategy is restricted to specific symbols
-            allowed_symbols = strategy.get_config('symbols')
-            if allowed_symbols and symbol and symbol not in allowed_symbols:
+            try:
+                signal = record.strategy.analyze(ticker, current_price, context)
+            except Exception as e:
+                logger.error(f"Strategy {record.name} error: {e}")
                 continue
 
-            try:
-                signal = strategy.analyze(ticker, current_price, context)
+            if signal is not None:
+                signal.metadata['strategy'] = record.name
+                signal.metadata['strategy_type'] = record.type
+                signals.append(signal)
+        return signals
+
+    def _analyze_loop_fast(self, ticker: Any, current_price: float,
+                           context: Mapping[str, Any], symbol: Optional[str]) -> List[StrategySignal]:
+        """Generic analyze_all() dispatcher with safe mode off: one handler for the whole scan."""
+        signals = []
+        current = None
+        try:
+            for record in self._enabled_cache:
+                symbol_filter = record.symbols
+                if symbol_filter is not None and symbol and symbol not in symbol_filter:
+                    continue
+
+                current = record.name
+                signal = record.strategy.analyze(ticker, current_price, context)
                 if signal is not None:
-                    # Tag signal with instance name and strategy type
-                    signal.metadata['strategy'] = instance_name
-                    signal.metadata['strategy_type'] = self._instance_types.get(instance_name, strategy.name)
+                    signal.metadata['strategy'] = current
+                    signal.metadata['strategy_type'] = record.type
                     signals.append(signal)
+        except Exception as e:
+            logger.error(f"Strategy {current} error: {e}")
+            return []
+        return signals
+
+    def analyze_batch(self, tickers: Sequence[Any], prices: Sequence[float],
+                      contexts: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> List[List[StrategySignal]]:
+        """
+        Run all enabled strategies over a batch of symbols.
+
+        Equivalent to calling analyze_all() for each (ticker, price, context),
+        but each strategy receives its whole share of the batch in one
+        analyze_batch() call, so strategies that support it can share work.
+        If a strategy raises, its remaining signals for this batch are dropped.
+
+        Args:
+            tickers: ib_insync Tickers with market data
+            prices: Current price for each ticker
+            contexts: Optional context for each ticker (should include 'symbol')
 
+        Returns:
+            One list of signals per input, in input order
+        """
+        count = len(tickers)
+        if contexts:
+            contexts = [_EMPTY_CTX if context is None else context for context in contexts]
+        else:
+            contexts = [_EMPTY_CTX] * count
+        symbols = [context.get('symbol') for context in contexts]
+        results: List[List[StrategySignal]] = [[] for _ in range(count)]
+
+        for record in self._enabled_cache:
+            instance_name = record.name
+            # Only pass the symbols this strategy is allowed to trade
+            symbol_filter = record.symbols
+            if symbol_filter is not None:
+                indices = [i for i in range(count)
+                           if not symbols[i] or symbols[i] in symbol_filter]
+            else:
+                indices = list(range(count))
+            if not indices:
+                continue
+
+            try:
+                signals = record.strategy.analyze_batch([tickers[i] for i in indices],
+                                                 [prices[i] for i in indices],
+                                                 [contexts[i] for i in indices])
             except Exception as e:
-                logger.error(f"Strategy {instance_name} error: {e}")
+                logger.error(f"Strategy {instance_name} batch error: {e}")
+                continue
 
-        return signals
+            strategy_type = record.type
+            for i, signal in zip(indices, signals):
+                if signal is not None:
+                    signal.metadata['strategy'] = instance_name
+                    signal.metadata['strategy_type'] = strategy_type
+                    results[i].append(signal)
+
+        return results
 
     def get_best_signal(self, ticker: Any, current_price: float,
                         context: Optional[Dict[str, Any]] = None) -> Optional[StrategySignal]:
@@ -307,49 +733,84 @@ class StrategyManager:
         Returns:
             Best signal or None if no signals
         """
-        signals = self.analyze_all(ticker, current_price, context)
+        return self._analyze_best(ticker, current_price, context)
 
-        if not signals:
-            return None
+    def _analyze_best(self, ticker: Any, current_price: float,
+                      context: Optional[Dict[str, Any]]) -> Optional[StrategySignal]:
+        """
+        analyze_all() and best-signal selection fused into a single pass.
+
+        Tracks the highest-confidence signal while the strategies run instead
+        of building the full signal list first, and only tags the winner.
+        """
+        if context is None:
+            context = _EMPTY_CTX
+        symbol = context.get('symbol')
+
+        best = None
+        best_confidence = -1.0
+        best_record = None
+        for record in self._enabled_cache:
+            symbol_filter = record.symbols
+            if symbol_filter is not None and symbol and symbol not in symbol_filter:
+                continue
+
+            try:
+                signal = record.strategy.analyze(ticker, current_price, context)
+            except Exception as e:
+                logger.error(f"Strategy {record.name} error: {e}")
+                continue
+
+            # First one wins ties, like max()
+            if signal is not None and signal.confidence > best_confidence:
+                best = signal
+                best_confidence = signal.confidence
+                best_record = record
 
-        # Return highest confidence signal
-        return max(signals, key=lambda s: s.confidence)
+        if best is not None:
+            best.metadata['strategy'] = best_record.name
+            best.metadata['strategy_type'] = best_record.type
+        return best
 
     def notify_position_opened(self, position: Any, strategy_name: Optional[str] = None):
         """Notify strategies that a position was opened."""
-        if strategy_name and strategy_name in self._strategies:
-            self._strategies[strategy_name].on_position_opened(position)
+        strategy = self._strategies.get(strategy_name) if strategy_name else None
+        if strategy is not None:
+            strategy.on_position_opened(position)
         else:
             # Notify all strategies
-            for strategy in self._strategies.values():
+            for strategy in self._all_strategies:
                 strategy.on_position_opened(position)
 
     def notify_position_closed(self, position: Any, reason: str,
                                strategy_name: Optional[str] = None):
         """Notify strategies that a position was closed."""
-        if strategy_name and strategy_name in self._strategies:
-            self._strategies[strategy_name].on_position_closed(position, reason)
+        strategy = self._strategies.get(strategy_name) if strategy_name else None
+        if strategy is not None:
+            strategy.on_position_closed(position, reason)
         else:
-            for strategy in self._strategies.values():
+            for strategy in self._all_strategies:
                 strategy.on_position_closed(position, reason)
 
     def get_strategy_type(self, instance_name: str) -> Optional[str]:
         """Get the strategy type for a loaded instance."""
-        return self._instance_types.get(instance_name)
+        record = self._records.get(instance_name)
+        return record.type if record is not None else None
 
     def get_status(self) -> Dict[str, Any]:
         """Get status of all loaded strategies."""
+        records = self._records
         return {
-            'loaded': len(self._strategies),
-            'enabled': sum(1 for v in self._enabled.values() if v),
+            'loaded': len(records),
+            'enabled': len(self._enabled_cache),
             'strategies': {
                 name: {
-                    'enabled': self._enabled.get(name, False),
-                    'type': self._instance_types.get(name, strategy.name),
-                    'version': strategy.version,
-                    'description': strategy.description,
+                    'enabled': record.enabled,
+                    'type': record.type,
+                    'version': record.strategy.version,
+                    'description': record.strategy.description,
                 }
-                for name, strategy in self._strategies.items()
+                for name, record in records.items()
             }
         }
 
@@ -367,39 +828,47 @@ class StrategyManager:
         Returns:
             True if reload succeeded, False otherwise
         """
-        if instance_name not in self._strategies:
+        record = self._records.get(instance_name)
+        if record is None:
             logger.warning(f"Cannot reload '{instance_name}' - not currently loaded")
             return False
 
-        # Remember enabled state and get strategy type
-        was_enabled = self._enabled.get(instance_name, True)
+        # A deferred strategy picks up the current code when it is first created
+        if isinstance(record.strategy, _LazyStrategy):
+            return True
+
         strategy_config = self._get_strategy_config(instance_name)
-        strategy_type = self._instance_types.get(instance_name, instance_name)
+        strategy_type = record.type
 
         try:
             # For built-in strategy types, reload via importlib
-            if strategy_type in self.BUILTIN_STRATEGIES:
-                module_path = self.BUILTIN_STRATEGIES[strategy_type]
-                module_name, class_name = module_path.rsplit('.', 1)
-
-                # Remove from sys.modules to force fresh import
-                if module_name in sys.modules:
-                    del sys.modules[module_name]
+            if record.source == 'builtin':
+                module_name, class_name = self.BUILTIN_STRATEGIES[strategy_type]
 
-                module = importlib.import_module(module_name)
+                # Re-execute the module in place; reload() returns it directly
+                module = sys.modules.get(module_name)
+                module = importlib.reload(module) if module is not None else importlib.import_module(module_name)
                 strategy_class = getattr(module, class_name)
                 new_strategy = strategy_class(strategy_config)
             else:
-                # File-based strategy - reload from file
+                # File-based strategy - rescan the directory and reload from
+                # file, bypassing the import cache
+                self._finder.invalidate_caches()
+                spec = self._finder.find_spec(f"{__package__}.{strategy_type}")
+                if spec is not None:
+                    self._invalidate_file_cache(str(Path(spec.origin).resolve()))
                 new_strategy = self._load_from_file(strategy_type, strategy_config)
 
             if new_strategy is None:
                 logger.error(f"Failed to reload strategy instance: {instance_name}")
                 return False
 
-            # Replace the old strategy
+            # Replace the old strategy; the record keeps its enabled state
             self._strategies[instance_name] = new_strategy
-            self._enabled[instance_name] = was_enabled
+            record.strategy = new_strategy
+            record.symbols = self._build_symbol_filter(new_strategy)
+            record.mtime = self._source_mtime(new_strategy)
+            self._rebuild_enabled_cache()
 
             logger.info(f"Reloaded strategy instance '{instance_name}': {new_strategy}")
             return True
@@ -408,39 +877,83 @@ class StrategyManager:
             logger.error(f"Error reloading strategy {instance_name}: {e}")
             return False
 
-    def reload_all(self) -> Dict[str, bool]:
+    @staticmethod
+    def _source_mtime(strategy: BaseStrategy) -> Optional[int]:
+        """mtime_ns of the file defining the strategy's class, or None if unknown."""
+        try:
+            return Path(inspect.getfile(type(strategy))).stat().st_mtime_ns
+        except (TypeError, OSError):
+            return None
+
+    def reload_all(self, force: bool = False) -> Dict[str, bool]:
         """
         Reload all currently loaded strategies.
 
+        Strategies whose source file has not changed since they were loaded
+        are skipped (and reported as succeeded) unless force is True.
+
+        Args:
+            force: Reload every strategy, even if its file is unchanged
+
         Returns:
             Dict mapping strategy name to reload success (True/False)
         """
         results = {}
-        for name in list(self._strategies.keys()):
+        for name, record in list(self._records.items()):
+            if (not force and record.mtime is not None
+                    and record.mtime == self._source_mtime(record.strategy)):
+                results[name] = True
+                continue
             results[name] = self.reload_strategy(name)
         return results
 
-    def discover_strategies(self) -> Set[str]:
+    def invalidate_caches(self):
+        """
+        Drop cached directory state so the next discovery rescans from disk.
+
+        Discovery trusts the strategies directory's mtime; call this (like
+        importlib.invalidate_caches()) when files may have changed within the
+        filesystem's mtime granularity.
+        """
+        self._discover_cache = None
+        self._finder.invalidate_caches()
+        importlib.invalidate_caches()
+
+    def discover_strategies(self) -> FrozenSet[str]:
         """
         Discover strategy files in the strategies directory that aren't loaded.
 
         Returns:
             Set of strategy names (filenames without .py) that could be loaded
         """
-        strategies_dir = Path(__file__).parent
+        # Adding, removing or renaming a file bumps the directory mtime,
+        # so an unchanged mtime means the previous scan is still valid.
+        # The cached set is immutable, so it is returned without copying.
+        mtime = _STRATEGIES_DIR.stat().st_mtime_ns
+        if self._discover_cache and self._discover_cache[0] == mtime:
+            return self._discover_cache[1]
+
         available: Set[str] = set()
 
-        for py_file in strategies_dir.glob("*.py"):
-            name = py_file.stem
-            if py_file.name not in EXCLUDED_FILES:
+        # scandir yields bare names, no Path object per directory entry
+        with os.scandir(_STRATEGIES_DIR) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not filename.endswith('.py'):
+                    continue
+                name = filename[:-3]
+                if name in _EXCLUDED_STEMS or name.startswith('_'):
+                    continue
                 available.add(name)
 
         # Also include built-in strategies
         available.update(self.BUILTIN_STRATEGIES.keys())
 
-        return available
+        discovered = frozenset(available)
+        self._discover_cache = (mtime, discovered)
+        return discovered
 
-    def get_unloaded_strategies(self) -> Set[str]:
+    def get_unloaded_strategies(self) -> FrozenSet[str]:
         """
         Get strategy types that are available but not used by any loaded instance.
 
@@ -448,7 +961,7 @@ class StrategyManager:
             Set of strategy type names that aren't backing any loaded instance
         """
         available = self.discover_strategies()
-        loaded_types = set(self._instance_types.values())
+        loaded_types = {record.type for record in self._records.values()}
         return available - loaded_types
 
     def load_new_strategies(self) -> int:
@@ -462,10 +975,6 @@ class StrategyManager:
         loaded_count = 0
 
         for name in unloaded:
-            # Skip template
-            if name == 'template':
-                continue
-
             config = self._get_strategy_config(name)
             # Only auto-load if explicitly enabled in config
             if config.get('enabled', False):
@@ -476,5 +985,4 @@ class StrategyManager:
         return loaded_count
 
     def __repr__(self) -> str:
-        enabled = sum(1 for v in self._enabled.values() if v)
-        return f"<StrategyManager strategies={len(self._strategies)} enabled={enabled}>"
+        return f"<StrategyManager strategies={len(self._records)} enabled={len(self._enabled_cache)}>"
@@ -18,39 +18,131 @@ This strategy looks for:
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import math
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque, namedtuple
+from typing import Deque, Dict, List, Optional, Any
 from dataclasses import dataclass
-from enum import Enum
-from datetime import datetime, timedelta
-import statistics
+from enum import IntEnum
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 
-from .base_strategy import BaseStrategy, StrategySignal, TradeDirection
+from .base_strategy import BaseStrategy, StrategySignal, TradeDirection, register_strategy
+from ._swing_kernels import NUMBA_AVAILABLE, NUMPY_AVAILABLE, np, swing_scan, warm_up, zscore_scan
 
 logger = logging.getLogger(__name__)
 
+# Tracked level times are integer nanoseconds since the Unix epoch
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+_LEVEL_TIMEOUT_NS = 30 * 1_000_000_000  # Drop a level missing for this long
+
+# Historical bars as parallel columns (only the fields the swing scan uses)
+_BarColumns = namedtuple('_BarColumns', ['timestamps', 'highs', 'lows'])
+
+# Per-symbol settings read on every tick, resolved once by _resolve_cfg()
+_Cfg = namedtuple('_Cfg', [
+    'instance_name',
+    'exclusion_pct',         # exclusion_zone_pct
+    'zscore_levels',         # zscore_levels_count
+    'zscore_threshold',
+    'liquidity_threshold',
+    'confirmation_ns',       # level_confirmation_minutes, in nanoseconds
+    'spoof_distance',        # spoofing_distance_ticks
+    'proximity_pct',         # zone_proximity_pct
+    'absorption_threshold',  # absorption_threshold_pct
+    'rejection_flip',        # rejection_imbalance_flip
+    'confidence_boost',      # power_level_confidence_boost
+    'volume_history_len',    # volume_history_length
+    'imbalance_weight',
+    'allowed_regimes',
+])
+
+# Sort keys (C-level attribute getters instead of per-element lambdas)
+_BY_STRENGTH = attrgetter('strength')
+_BY_CURRENT_VOLUME = attrgetter('current_volume')
+_BY_DECAYED_STRENGTH = attrgetter('decayed_strength')
+_BY_PRICE = attrgetter('price')
+_BY_COMBINED_CONFIDENCE = attrgetter('combined_confidence')
+
+
+class Pattern(IntEnum):
+    """
+    Trading pattern types detected by this strategy.
 
-class Pattern(Enum):
-    """Trading pattern types detected by this strategy."""
-    TESTING_SUPPORT = "testing_support"
-    TESTING_RESISTANCE = "testing_resistance"
-    REJECTION_AT_SUPPORT = "rejection_at_support"
-    REJECTION_AT_RESISTANCE = "rejection_at_resistance"
-    ABSORPTION_BREAKOUT_UP = "absorption_breakout_up"
-    ABSORPTION_BREAKOUT_DOWN = "absorption_breakout_down"
-    CONSOLIDATION = "consolidation"
-    SPOOFING_DETECTED = "spoofing_detected"
-
-
-class LevelState(Enum):
-    """State of a price level in the interaction state machine."""
-    PENDING = "pending"          # Level detected but not confirmed
-    CONFIRMED = "confirmed"      # Level held for required time
-    ABSORBING = "absorbing"      # Volume being absorbed (iceberg)
-    REJECTED = "rejected"        # Price rejected at level
-    INVALIDATED = "invalidated"  # Level spoofed or broken
+    Integer-valued so comparisons and dict lookups stay in C; the string
+    name used in signals and logs comes from _PATTERN_NAMES.
+    """
+    TESTING_SUPPORT = 0
+    TESTING_RESISTANCE = 1
+    REJECTION_AT_SUPPORT = 2
+    REJECTION_AT_RESISTANCE = 3
+    ABSORPTION_BREAKOUT_UP = 4
+    ABSORPTION_BREAKOUT_DOWN = 5
+    CONSOLIDATION = 6
+    SPOOFING_DETECTED = 7
+
+
+class LevelState(IntEnum):
+    """State of a price level in the interaction state machine (names in _STATE_NAMES)."""
+    PENDING = 0          # Level detected but not confirmed
+    CONFIRMED = 1        # Level held for required time
+    ABSORBING = 2        # Volume being absorbed (iceberg)
+    REJECTED = 3         # Price rejected at level
+    INVALIDATED = 4      # Level spoofed or broken
+
+
+# External string names, e.g. Pattern.REJECTION_AT_SUPPORT -> 'rejection_at_support'
+_PATTERN_NAMES = {pattern: pattern.name.lower() for pattern in Pattern}
+_STATE_NAMES = {state: state.name.lower() for state in LevelState}
+
+# Config key holding each tradeable pattern's minimum confidence ('min_confidence' otherwise)
+_RULE_KEY_MAP = {
+    Pattern.REJECTION_AT_SUPPORT: 'rejection_support_confidence',
+    Pattern.REJECTION_AT_RESISTANCE: 'rejection_resistance_confidence',
+    Pattern.ABSORPTION_BREAKOUT_UP: 'absorption_confidence',
+    Pattern.ABSORPTION_BREAKOUT_DOWN: 'absorption_confidence',
+}
+
+
+def _local_zscores(volumes, half_window: int):
+    """
+    Z-score of every volume against its neighbours, in one NumPy pass.
 
+    Each level's window is the levels within half_window on either side
+    (truncated at the ends of the book), including the level itself.
+    Matches BaseStrategy.calculate_zscore() on that window: sample standard
+    deviation, and 0.0 for windows of fewer than 2 levels or zero spread.
+    Returns a float64 array with one Z-score per volume.
 
-@dataclass
+    Window sums come from prefix sums of the volumes and their squares, so
+    the cost is O(n) regardless of the window size. The variance numerator
+    n*sum(x^2) - sum(x)^2 is exact for integer volumes (up to ~1e7 per level).
+    """
+    values = np.asarray(volumes, dtype=np.float64)
+    n = len(values)
+    csum = np.zeros(n + 1)
+    np.cumsum(values, out=csum[1:])
+    csum2 = np.zeros(n + 1)
+    np.cumsum(values * values, out=csum2[1:])
+
+    index = np.arange(n)
+    lo = np.maximum(index - half_window, 0)
+    hi = np.minimum(index + half_window + 1, n)
+    counts = hi - lo
+    sums = csum[hi] - csum[lo]
+    spread = counts * (csum2[hi] - csum2[lo]) - sums * sums
+
+    zscores = np.zeros(n)
+    significant = (counts >= 2) & (spread > 0)
+    counts = counts[significant]
+    stdevs = np.sqrt(spread[significant] / (counts * (counts - 1)))
+    zscores[significant] = (values[significant] - sums[significant] / counts) / stdevs
+    return zscores
+
+
+@dataclass(slots=True)
 class LiquidityZone:
     """Represents a liquidity zone in the order book."""
     price: float
@@ -60,13 +152,13 @@ class LiquidityZone:
     zscore: float = 0.0  # Statistical significance
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackedLevel:
     """A price level being tracked for confirmation and state transitions."""
     price: float
     zone_type: str  # 'support' or 'resistance'
-    first_seen: datetime
-    last_seen: datetime
+    first_seen: int  # Epoch nanoseconds
+    last_seen: int   # Epoch nanoseconds
     initial_volume: int
     current_volume: int
     volume_traded: int = 0  # Volume absorbed at this level
@@ -78,7 +170,7 @@ class TrackedLevel:
 # Historical Bounce Detection Data Structures
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SwingPoint:
     """A local extremum (swing high or low) identified in historical price data."""
     price: float
@@ -87,7 +179,7 @@ class SwingPoint:
     bar_index: int = 0  # Index in the bar array for reference
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoricalBounceLevel:
     """
     A price level that has been tested multiple times historically.
@@ -106,7 +198,7 @@ class HistoricalBounceLevel:
     decayed_strength: float = 0.0     # Strength after applying time decay
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerLevel:
     """
     A 'Power Level' where historical bounce and real-time depth converge.
@@ -124,6 +216,7 @@ class PowerLevel:
     is_valid: bool                    # False if depth is weakened (skip trade)
 
 
+@register_strategy('swing_trading')
 class SwingTradingStrategy(BaseStrategy):
     """
     Swing trading strategy based on order book liquidity analysis.
@@ -152,17 +245,23 @@ class SwingTradingStrategy(BaseStrategy):
         self._tracked_levels: Dict[str, Dict[float, TrackedLevel]] = {}  # symbol -> {price: level}
 
         # Volume history for absorption detection
-        self._volume_history: Dict[str, Dict[float, List[int]]] = {}  # symbol -> {price: [volumes]}
+        self._volume_history: Dict[str, Dict[float, Deque[int]]] = {}  # symbol -> {price: recent volumes}
+        self._volume_stats: Dict[str, Dict[float, List[int]]] = {}  # symbol -> {price: [sum, sum of squares]}
 
         # Historical bounce detection
         self._historical_levels: Dict[str, List[HistoricalBounceLevel]] = {}  # symbol -> bounce levels
+        self._historical_index: Dict[str, Dict[str, tuple]] = {}  # symbol -> {type: (sorted prices, level indices)}
         self._power_levels: Dict[str, List[PowerLevel]] = {}  # symbol -> power levels
-        self._historical_last_update: Dict[str, datetime] = {}  # symbol -> last fetch time
+        self._historical_next_refresh: Dict[str, float] = {}  # symbol -> time.time() when levels go stale
+        self._historical_enabled = bool(self.get_config('historical_bounce_enabled', True))
 
         # External dependencies (set via setter methods)
         self._ib_wrapper: Optional[Any] = None  # IBWrapper for historical data
         self._trade_db: Optional[Any] = None    # TradeDatabase for caching
 
+        # Resolved per-tick settings, cleared on set_config()
+        self._cfg_cache: Dict[str, _Cfg] = {}  # symbol -> settings
+
         # Trading rules: pattern -> (direction, min_confidence)
         self._rules = {
             Pattern.REJECTION_AT_SUPPORT: (
@@ -183,6 +282,13 @@ class SwingTradingStrategy(BaseStrategy):
             ),
         }
 
+        # Output buffers for zscore_scan, reused across calls (grown on demand)
+        self._scan_index = np.empty(0, dtype=np.int64) if NUMBA_AVAILABLE else None
+        self._scan_zscore = np.empty(0, dtype=np.float64) if NUMBA_AVAILABLE else None
+
+        # Exercise the compiled kernels before live ticks arrive
+        warm_up()
+
     @property
     def name(self) -> str:
         return "swing_trading"
@@ -225,6 +331,7 @@ class SwingTradingStrategy(BaseStrategy):
             'absorption_threshold_pct': 0.20,   # 20% volume traded = absorption
             'rejection_imbalance_flip': 0.60,   # 60% imbalance flip = rejection
             'spoofing_distance_ticks': 3,       # Cancel within 3 ticks = spoofing
+            'volume_history_length': 20,        # Volume samples kept per level for absorption (min 3)
 
             # Confidence thresholds for each pattern
             'rejection_support_confidence': 0.65,
@@ -278,6 +385,34 @@ class SwingTradingStrategy(BaseStrategy):
             'pnl_baseline': 50.0,               # $50 avg profit = "good" baseline
         }
 
+    def on_config_change(self, key: str):
+        """Drop resolved per-symbol settings so the next tick re-reads them."""
+        self._cfg_cache.clear()
+        self._historical_enabled = bool(self.get_config('historical_bounce_enabled', True))
+
+    def _resolve_cfg(self, symbol: str) -> _Cfg:
+        """Read the per-tick settings for a symbol (with overrides) and cache them."""
+        get = self.get_config
+        cfg = _Cfg(
+            instance_name=get('instance_name', self.name, symbol=symbol),
+            exclusion_pct=get('exclusion_zone_pct', 0.005, symbol=symbol),
+            zscore_levels=get('zscore_levels_count', 10, symbol=symbol),
+            zscore_threshold=get('zscore_threshold', 3.0, symbol=symbol),
+            liquidity_threshold=get('liquidity_threshold', 1000, symbol=symbol),
+            confirmation_ns=int(get('level_confirmation_minutes', 5, symbol=symbol) * 60 * 1_000_000_000),
+            spoof_distance=get('spoofing_distance_ticks', 3, symbol=symbol),
+            proximity_pct=get('zone_proximity_pct', 0.005, symbol=symbol),
+            absorption_threshold=get('absorption_threshold_pct', 0.20, symbol=symbol),
+            rejection_flip=get('rejection_imbalance_flip', 0.60, symbol=symbol),
+            confidence_boost=get('power_level_confidence_boost', 0.15, symbol=symbol),
+            # Absorption needs at least 3 samples; shorter (or invalid) lengths are raised to 3
+            volume_history_len=max(3, int(get('volume_history_length', 20, symbol=symbol))),
+            imbalance_weight=get('imbalance_weight', 0.3, symbol=symbol),
+            allowed_regimes=get('allowed_regimes', symbol=symbol),
+        )
+        self._cfg_cache[symbol] = cfg
+        return cfg
+
     def analyze(self, ticker: Any, current_price: float,
                 context: Optional[Dict[str, Any]] = None) -> Optional[StrategySignal]:
         """
@@ -293,41 +428,45 @@ class SwingTradingStrategy(BaseStrategy):
         """
         context = context or {}
         symbol = context.get('symbol', 'UNKNOWN')
+        cfg = self._cfg_cache.get(symbol) or self._resolve_cfg(symbol)
         
         # --- 1. Check Market Regime (Optimization & Logging) ---
         regime = context.get('market_regime')
         if regime:
-            allowed_regimes = self.get_config('allowed_regimes', symbol=symbol)
+            allowed_regimes = cfg.allowed_regimes
             if allowed_regimes and regime.value not in allowed_regimes:
-                instance_name = self.get_config('instance_name', self.name, symbol=symbol)
-                logger.info(f"{instance_name} ({symbol}): Skipping - Regime {regime.value} not in {allowed_regimes}")
+                logger.info(f"{cfg.instance_name} ({symbol}): Skipping - Regime {regime.value} not in {allowed_regimes}")
                 return None
 
         if ticker is None:
-            instance_name = self.get_config('instance_name', self.name, symbol=symbol)
-            logger.info(f"{instance_name} ({symbol}): Skipping - No market depth data available")
+            logger.info(f"{cfg.instance_name} ({symbol}): Skipping - No market depth data available")
             return None
             
-        now = ticker.time if ticker.time else datetime.now()
-        # FIX: Ensure now is timezone-aware to prevent offset-naive/aware subtraction errors
-        if now.tzinfo is None:
-            now = now.astimezone()
+        # Tick time as epoch nanoseconds; naive tick times are local time
+        tick_time = ticker.time
+        if tick_time:
+            if tick_time.tzinfo is None:
+                tick_time = tick_time.astimezone()
+            now_ns = (tick_time - _EPOCH) // _ONE_US * 1000
+        else:
+            now_ns = time.time_ns()
 
         # Initialize tracking for this symbol
         if symbol not in self._tracked_levels:
             self._tracked_levels[symbol] = {}
         if symbol not in self._volume_history:
             self._volume_history[symbol] = {}
+            self._volume_stats[symbol] = {}
 
         # Analyze order book with Z-score filtering
-        analysis = self._analyze_book_advanced(ticker, current_price, symbol)
+        analysis = self._analyze_book_advanced(ticker, current_price, symbol, cfg)
 
         # Update level tracking and state machine
-        self._update_level_tracking(symbol, analysis, current_price, now)
+        self._update_level_tracking(symbol, analysis, current_price, now_ns, cfg)
 
         # Check for spoofing
-        spoofed_levels = self._detect_spoofing(symbol, analysis, current_price)
-        instance_name = self.get_config('instance_name', self.name, symbol=symbol)
+        spoofed_levels = self._detect_spoofing(symbol, analysis, current_price, cfg)
+        instance_name = cfg.instance_name
         for level_price in spoofed_levels:
             logger.info(f"{instance_name} ({symbol}): Spoofing detected at ${level_price:.2f}")
 
@@ -336,55 +475,57 @@ class SwingTradingStrategy(BaseStrategy):
         confirmed_resistance = self._get_confirmed_levels(symbol, 'resistance')
 
         # Update historical bounce levels (cached, refreshes when stale)
-        if self.get_config('historical_bounce_enabled', True):
+        if self._historical_enabled and time.time() >= self._historical_next_refresh.get(symbol, 0.0):
             self._update_historical_levels(symbol, current_price, symbol)
 
         # Detect power levels (historical + depth convergence)
         all_depth_levels = confirmed_support + confirmed_resistance
         power_levels = self._detect_power_levels(symbol, all_depth_levels, current_price)
 
-        # Log current state
-        if confirmed_support:
-            support_str = f"${confirmed_support[0].price:.2f}"
-        else:
-            pending_sup = len([l for l in self._tracked_levels[symbol].values() if l.zone_type == 'support' and l.state == LevelState.PENDING])
-            support_str = f"none ({pending_sup} pending)"
-
-        if confirmed_resistance:
-            resistance_str = f"${confirmed_resistance[0].price:.2f}"
-        else:
-            pending_res = len([l for l in self._tracked_levels[symbol].values() if l.zone_type == 'resistance' and l.state == LevelState.PENDING])
-            resistance_str = f"none ({pending_res} pending)"
-            
-        power_str = f", power_levels={len(power_levels)}" if power_levels else ""
-
         # Check for Power Level patterns first (they have higher priority)
         pattern_result = self._detect_pattern_at_power_levels(
-            current_price, symbol, analysis, power_levels
+            current_price, symbol, analysis, power_levels, cfg
         )
 
         # Fall back to regular pattern detection if no power level match
         if pattern_result is None:
             pattern_result = self._detect_pattern(
                 ticker, current_price, symbol, analysis,
-                confirmed_support, confirmed_resistance
+                confirmed_support, confirmed_resistance, cfg
             )
 
-        # Determine pattern name and confidence for logging
-        if pattern_result is None:
-            pattern_name = "consolidation"
-            confidence_val = 0.0
-        else:
-            pattern, confidence_val, price_level, imbalance, metadata = pattern_result
-            pattern_name = pattern.value
-
-        # Use instance_name from config for logging (falls back to strategy type name)
-        instance_name = self.get_config('instance_name', self.name, symbol=symbol)
-        logger.info(
-            f"{instance_name} ({symbol}): price=${current_price:.2f}, "
-            f"support={support_str}, resistance={resistance_str}, "
-            f"pattern={pattern_name}, confidence={confidence_val:.2f}{power_str}"
-        )
+        # Log current state (skipped entirely, pending counts included, when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            if confirmed_support and confirmed_resistance:
+                pending_sup = pending_res = 0
+            else:
+                pending_sup, pending_res = self._count_pending(symbol)
+
+            if confirmed_support:
+                support_str = f"${confirmed_support[0].price:.2f}"
+            else:
+                support_str = f"none ({pending_sup} pending)"
+
+            if confirmed_resistance:
+                resistance_str = f"${confirmed_resistance[0].price:.2f}"
+            else:
+                resistance_str = f"none ({pending_res} pending)"
+
+            power_str = f", power_levels={len(power_levels)}" if power_levels else ""
+
+            # Determine pattern name and confidence for logging
+            if pattern_result is None:
+                pattern_name = "consolidation"
+                confidence_val = 0.0
+            else:
+                pattern_name = _PATTERN_NAMES[pattern_result[0]]
+                confidence_val = pattern_result[1]
+
+            logger.info(
+                f"{instance_name} ({symbol}): price=${current_price:.2f}, "
+                f"support={support_str}, resistance={resistance_str}, "
+                f"pattern={pattern_name}, confidence={confidence_val:.2f}{power_str}"
+            )
 
         if pattern_result is None:
             return None
@@ -399,13 +540,7 @@ class SwingTradingStrategy(BaseStrategy):
         direction, _ = self._rules[pattern]
         
         # Re-fetch min_confidence with symbol context
-        rule_key_map = {
-            Pattern.REJECTION_AT_SUPPORT: 'rejection_support_confidence',
-            Pattern.REJECTION_AT_RESISTANCE: 'rejection_resistance_confidence',
-            Pattern.ABSORPTION_BREAKOUT_UP: 'absorption_confidence',
-            Pattern.ABSORPTION_BREAKOUT_DOWN: 'absorption_confidence',
-        }
-        min_confidence = self.get_config(rule_key_map.get(pattern, 'min_confidence'), 0.65, symbol=symbol)
+        min_confidence = self.get_config(_RULE_KEY_MAP.get(pattern, 'min_confidence'), 0.65, symbol=symbol)
 
         raw_confidence = confidence
         confidence = self.apply_performance_feedback(confidence, instance_name)
@@ -417,28 +552,30 @@ class SwingTradingStrategy(BaseStrategy):
 
         # Check confidence threshold
         if confidence < min_confidence:
-            logger.debug(
-                f"{symbol}: {pattern.value} confidence {confidence:.2f} "
-                f"below threshold {min_confidence:.2f}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"{symbol}: {_PATTERN_NAMES[pattern]} confidence {confidence:.2f} "
+                    f"below threshold {min_confidence:.2f}"
+                )
             return None
 
         # Generate signal
+        pattern_name = _PATTERN_NAMES[pattern]
         return StrategySignal(
             direction=direction,
             confidence=confidence,
-            pattern_name=pattern.value,
+            pattern_name=pattern_name,
             price_level=price_level,
             metadata={
                 'imbalance': imbalance,
-                'pattern': pattern.value,
+                'pattern': pattern_name,
                 'strategy_type': 'swing_trading',
                 **metadata
             }
         )
 
     def _analyze_book_advanced(self, ticker: Any, current_price: float,
-                                symbol: str) -> Dict:
+                                symbol: str, cfg: _Cfg) -> Dict:
         """
         Analyze order book with Z-score filtering and exclusion zone.
 
@@ -461,15 +598,12 @@ class SwingTradingStrategy(BaseStrategy):
         bid_liquidity = {bid.price: bid.size for bid in ticker.domBids if bid.price > 0}
         ask_liquidity = {ask.price: ask.size for ask in ticker.domAsks if ask.price > 0}
 
-        # Calculate exclusion zone
-        exclusion_pct = self.get_config('exclusion_zone_pct', 0.005, symbol=symbol)
-
         # Identify significant zones with Z-score filtering
         support_zones = self._identify_zones_zscore(
-            bid_liquidity, 'support', current_price, exclusion_pct
+            bid_liquidity, 'support', current_price, cfg
         )
         resistance_zones = self._identify_zones_zscore(
-            ask_liquidity, 'resistance', current_price, exclusion_pct
+            ask_liquidity, 'resistance', current_price, cfg
         )
 
         # Calculate metrics
@@ -488,95 +622,134 @@ class SwingTradingStrategy(BaseStrategy):
         }
 
     def _identify_zones_zscore(self, liquidity: Dict[float, int], zone_type: str,
-                                current_price: float, exclusion_pct: float, symbol: str = None) -> List[LiquidityZone]:
+                                current_price: float, cfg: _Cfg) -> List[LiquidityZone]:
         """
         Identify significant liquidity zones using Z-score filtering.
 
         Only zones with volume >3σ above local average are considered.
         Zones within the exclusion zone are filtered out.
         """
-        if not liquidity:
+        n = len(liquidity)
+        if n < 2:
             return []
 
         zones = []
-        prices = sorted(liquidity.keys())
-        volumes = [liquidity[p] for p in prices]
-
-        if len(volumes) < 2:
-            return []
 
-        # Calculate local statistics for Z-score
-        zscore_levels = self.get_config('zscore_levels_count', 10, symbol=symbol)
-        zscore_threshold = self.get_config('zscore_threshold', 3.0, symbol=symbol)
-        liquidity_threshold = self.get_config('liquidity_threshold', 1000, symbol=symbol)
-        max_size = max(volumes) if volumes else 1
-
-        for i, price in enumerate(prices):
-            size = liquidity[price]
-
-            # Skip if below base threshold
-            if size < liquidity_threshold:
-                continue
-
-            # Skip if in exclusion zone
-            if self.is_in_exclusion_zone(current_price, price, exclusion_pct, symbol=symbol):
-                continue
-
-            # Get nearby volumes for local Z-score calculation
-            start_idx = max(0, i - zscore_levels // 2)
-            end_idx = min(len(volumes), i + zscore_levels // 2 + 1)
-            nearby = volumes[start_idx:end_idx]
-
-            # Calculate Z-score
-            if len(nearby) >= 2:
-                zscore = self.calculate_zscore(float(size), [float(v) for v in nearby])
+        exclusion_pct = cfg.exclusion_pct
+        zscore_levels = cfg.zscore_levels
+        zscore_threshold = cfg.zscore_threshold
+        liquidity_threshold = cfg.liquidity_threshold
+        max_size = max(liquidity.values())
+
+        if NUMPY_AVAILABLE:
+            # Book straight into price/volume arrays, sorted by price in C
+            prices = np.fromiter(liquidity.keys(), dtype=np.float64, count=n)
+            volumes = np.fromiter(liquidity.values(), dtype=np.float64, count=n)
+            order = prices.argsort()
+            prices = prices[order]
+            volumes = volumes[order]
+
+            if NUMBA_AVAILABLE:
+                # Compiled scan returns just the qualifying levels
+                if len(self._scan_index) < n:
+                    size = max(n, 2 * len(self._scan_index))
+                    self._scan_index = np.empty(size, dtype=np.int64)
+                    self._scan_zscore = np.empty(size, dtype=np.float64)
+                count = zscore_scan(prices, volumes, current_price, exclusion_pct,
+                                    zscore_threshold, zscore_levels // 2, liquidity_threshold,
+                                    self._scan_index, self._scan_zscore)
+                survivors = self._scan_index[:count]
+                survivor_zscores = self._scan_zscore[:count]
             else:
-                zscore = 0.0
+                # Z-scores use every level in the window, but only levels that
+                # pass the size, exclusion and significance masks become zones
+                zscores = _local_zscores(volumes, zscore_levels // 2)
+                survivors = np.flatnonzero(
+                    (volumes >= liquidity_threshold)
+                    & (np.abs(current_price - prices) > current_price * exclusion_pct)
+                    & (zscores >= zscore_threshold)
+                )
+                survivor_zscores = zscores[survivors]
 
-            # Only include if statistically significant
-            if zscore >= zscore_threshold:
-                strength = size / max_size
+            for price, zscore in zip(prices[survivors].tolist(), survivor_zscores.tolist()):
+                size = liquidity[price]
                 zones.append(LiquidityZone(
                     price=price,
                     size=size,
                     zone_type=zone_type,
-                    strength=strength,
+                    strength=size / max_size,
                     zscore=zscore
                 ))
+        else:
+            prices = sorted(liquidity.keys())
+            volumes = [liquidity[p] for p in prices]
+            exclusion_distance = current_price * exclusion_pct
+
+            for i, price in enumerate(prices):
+                size = liquidity[price]
+
+                # Skip if below base threshold
+                if size < liquidity_threshold:
+                    continue
+
+                # Skip if in exclusion zone
+                if abs(current_price - price) <= exclusion_distance:
+                    continue
+
+                # Get nearby volumes for local Z-score calculation
+                start_idx = max(0, i - zscore_levels // 2)
+                end_idx = min(len(volumes), i + zscore_levels // 2 + 1)
+                nearby = volumes[start_idx:end_idx]
+
+                # Calculate Z-score
+                if len(nearby) >= 2:
+                    zscore = self.calculate_zscore(float(size), [float(v) for v in nearby])
+                else:
+                    zscore = 0.0
+
+                # Only include if statistically significant
+                if zscore >= zscore_threshold:
+                    strength = size / max_size
+                    zones.append(LiquidityZone(
+                        price=price,
+                        size=size,
+                        zone_type=zone_type,
+                        strength=strength,
+                        zscore=zscore
+                    ))
 
         # Sort by strength
-        zones.sort(key=lambda z: z.strength, reverse=True)
+        zones.sort(key=_BY_STRENGTH, reverse=True)
         return zones
 
     def _update_level_tracking(self, symbol: str, analysis: Dict,
-                                current_price: float, now: datetime):
+                                current_price: float, now_ns: int, cfg: _Cfg):
         """
         Update tracking for level time-persistence and state machine.
 
-        Levels must persist for 5 minutes to become confirmed.
+        Levels must persist for 5 minutes to become confirmed. Times are
+        integer epoch nanoseconds, so the checks are plain int comparisons.
         """
         tracked = self._tracked_levels[symbol]
-        confirmation_time = timedelta(minutes=self.get_config('level_confirmation_minutes', 5, symbol=symbol))
-
-        # Ensure 'now' is timezone-aware
-        if now.tzinfo is None:
-            now = now.astimezone()
+        volume_history = self._volume_history[symbol]
+        volume_stats = self._volume_stats[symbol]
+        confirmation_ns = cfg.confirmation_ns
 
         # Track all significant zones from current analysis
         all_zones = analysis['support'] + analysis['resistance']
-        current_prices = {z.price for z in all_zones}
-
-        # Update existing tracked levels
-        for price in list(tracked.keys()):
-            level = tracked[price]
+        # Built in reverse so the first zone wins if a price is on both sides
+        zone_by_price = {z.price: z for z in reversed(all_zones)}
 
+        # Update existing tracked levels; expired ones are removed after the pass
+        expired = []
+        for price, level in tracked.items():
             # Check if level is in current analysis OR hidden by exclusion zone but in raw data
             is_present = False
             current_size = 0
 
-            if price in current_prices:
+            zone = zone_by_price.get(price)
+            if zone is not None:
                 is_present = True
-                zone = next(z for z in all_zones if z.price == price)
                 current_size = zone.size
             else:
                 # Check raw liquidity to see if it's hidden (e.g. inside exclusion zone)
@@ -590,43 +763,47 @@ class SwingTradingStrategy(BaseStrategy):
 
             if is_present:
                 # Level still exists - update it
-                level.last_seen = now
+                level.last_seen = now_ns
                 level.current_volume = current_size
 
                 # Check for volume refresh (iceberg behavior)
                 if current_size > level.current_volume * 0.8:
                     level.refresh_count += 1
 
-                # Update volume history for absorption detection
-                if price not in self._volume_history[symbol]:
-                    self._volume_history[symbol][price] = []
-                self._volume_history[symbol][price].append(current_size)
-                # Keep only last 20 observations
-                self._volume_history[symbol][price] = self._volume_history[symbol][price][-20:]
+                # Update volume history for absorption detection (bounded, oldest dropped)
+                # and its running sum / sum of squares; the deque evicts the oldest
+                # sample on append, so take it out of the sums first
+                history = volume_history.get(price)
+                if history is None:
+                    history = volume_history[price] = deque(maxlen=cfg.volume_history_len)
+                    stats = volume_stats[price] = [0, 0]
+                else:
+                    stats = volume_stats[price]
+                    if len(history) == history.maxlen:
+                        oldest = history[0]
+                        stats[0] -= oldest
+                        stats[1] -= oldest * oldest
+                history.append(current_size)
+                stats[0] += current_size
+                stats[1] += current_size * current_size
 
                 # Check for confirmation
                 if level.state == LevelState.PENDING:
-                    # FIX: Normalize timestamps for comparison
-                    first_seen = level.first_seen
-                    if first_seen.tzinfo is None:
-                        first_seen = first_seen.astimezone()
-
-                    if now - first_seen >= confirmation_time:
+                    if now_ns - level.first_seen >= confirmation_ns:
                         level.state = LevelState.CONFIRMED
-                        logger.debug(f"Level confirmed: ${price:.2f} ({level.zone_type})")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Level confirmed: ${price:.2f} ({level.zone_type})")
 
             else:
                 # Level disappeared
-                last_seen = level.last_seen
-                if last_seen.tzinfo is None:
-                    last_seen = last_seen.astimezone()
-
-                age = now - last_seen
-                if age > timedelta(seconds=30):
+                if now_ns - level.last_seen > _LEVEL_TIMEOUT_NS:
                     # Level gone for 30+ seconds - could be spoofing or broken
                     if level.state == LevelState.CONFIRMED:
                         level.state = LevelState.INVALIDATED
-                    del tracked[price]
+                    expired.append(price)
+
+        for price in expired:
+            del tracked[price]
 
         # Add new levels
         for zone in all_zones:
@@ -634,15 +811,15 @@ class SwingTradingStrategy(BaseStrategy):
                 tracked[zone.price] = TrackedLevel(
                     price=zone.price,
                     zone_type=zone.zone_type,
-                    first_seen=now,
-                    last_seen=now,
+                    first_seen=now_ns,
+                    last_seen=now_ns,
                     initial_volume=zone.size,
                     current_volume=zone.size,
                     state=LevelState.PENDING
                 )
 
     def _detect_spoofing(self, symbol: str, analysis: Dict,
-                          current_price: float) -> List[float]:
+                          current_price: float, cfg: _Cfg) -> List[float]:
         """
         Detect potential spoofing: large orders pulled as price approaches.
 
@@ -650,34 +827,39 @@ class SwingTradingStrategy(BaseStrategy):
         """
         spoofed = []
         tracked = self._tracked_levels[symbol]
-        spoof_distance = self.get_config('spoofing_distance_ticks', 3, symbol=symbol)
+        volume_history = self._volume_history.get(symbol, {})
+        spoof_distance = cfg.spoof_distance
 
         # Calculate approximate tick size (0.01 for most stocks)
         tick_size = 0.01
         spoof_range = spoof_distance * tick_size
+        confirmed = LevelState.CONFIRMED
 
-        for price, level in list(tracked.items()):
-            if level.state != LevelState.CONFIRMED:
+        for price, level in tracked.items():
+            # Check if price is within spoof range of a confirmed level
+            if level.state != confirmed or abs(current_price - price) > spoof_range:
                 continue
 
-            distance = abs(current_price - price)
-
-            # Check if price is within spoof range and level disappeared
-            if distance <= spoof_range:
-                # Check if this level's volume dropped significantly
-                history = self._volume_history.get(symbol, {}).get(price, [])
-                if len(history) >= 2:
-                    recent_vol = history[-1] if history else 0
-                    prev_vol = history[-2] if len(history) >= 2 else level.initial_volume
-
-                    # Volume dropped by >50% as price approached
-                    if recent_vol < prev_vol * 0.5:
-                        spoofed.append(price)
-                        level.state = LevelState.INVALIDATED
-                        logger.warning(f"Spoofing detected at ${price:.2f}")
+            # Volume dropped by >50% as price approached
+            history = volume_history.get(price, ())
+            if len(history) >= 2 and history[-1] < history[-2] * 0.5:
+                spoofed.append(price)
+                level.state = LevelState.INVALIDATED
+                logger.warning(f"Spoofing detected at ${price:.2f}")
 
         return spoofed
 
+    def _count_pending(self, symbol: str) -> tuple:
+        """Count pending (unconfirmed) support and resistance levels in one pass."""
+        pending_sup = pending_res = 0
+        for level in self._tracked_levels[symbol].values():
+            if level.state == LevelState.PENDING:
+                if level.zone_type == 'support':
+                    pending_sup += 1
+                elif level.zone_type == 'resistance':
+                    pending_res += 1
+        return pending_sup, pending_res
+
     def _get_confirmed_levels(self, symbol: str,
                                zone_type: str) -> List[TrackedLevel]:
         """Get confirmed levels of specified type, sorted by strength."""
@@ -687,12 +869,12 @@ class SwingTradingStrategy(BaseStrategy):
             if level.zone_type == zone_type and level.state == LevelState.CONFIRMED
         ]
         # Sort by current volume (proxy for strength)
-        confirmed.sort(key=lambda l: l.current_volume, reverse=True)
+        confirmed.sort(key=_BY_CURRENT_VOLUME, reverse=True)
         return confirmed
 
     def _detect_pattern(self, ticker: Any, current_price: float, symbol: str,
                         analysis: Dict, confirmed_support: List[TrackedLevel],
-                        confirmed_resistance: List[TrackedLevel]) -> Optional[tuple]:
+                        confirmed_resistance: List[TrackedLevel], cfg: _Cfg) -> Optional[tuple]:
         """
         Detect trading pattern from confirmed levels and state machine.
 
@@ -701,18 +883,20 @@ class SwingTradingStrategy(BaseStrategy):
             or None if only consolidation detected
         """
         imbalance = analysis['imbalance']
-        proximity_pct = self.get_config('zone_proximity_pct', 0.005, symbol=symbol)
-        absorption_threshold = self.get_config('absorption_threshold_pct', 0.20, symbol=symbol)
-        rejection_flip = self.get_config('rejection_imbalance_flip', 0.60, symbol=symbol)
+        # Zone proximity in dollars, shared by every level check below
+        proximity = current_price * cfg.proximity_pct
+        absorption_threshold = cfg.absorption_threshold
+        rejection_flip = cfg.rejection_flip
+        imbalance_weight = cfg.imbalance_weight
 
         # Check support zones
         for level in confirmed_support:
-            if self.is_price_near_level(current_price, level.price, proximity_pct):
+            if abs(current_price - level.price) <= proximity:
                 # Check for absorption (breakout signal)
                 if self._is_absorbing(symbol, level, absorption_threshold):
                     confidence = self._adjust_confidence_by_imbalance(
                         level.current_volume / level.initial_volume,
-                        imbalance, bullish=True, symbol=symbol
+                        imbalance, bullish=True, weight=imbalance_weight
                     )
                     return (
                         Pattern.ABSORPTION_BREAKOUT_UP,
@@ -723,12 +907,12 @@ class SwingTradingStrategy(BaseStrategy):
                     )
 
                 # Check for rejection (bounce signal)
-                if self._is_bouncing_off_support(current_price, level.price, symbol):
+                if self._is_bouncing_off_support(current_price, level.price, symbol, proximity):
                     # Check imbalance confirms the bounce
                     if imbalance > -rejection_flip:  # Not heavily bearish
                         base_confidence = min(1.0, level.current_volume / 10000)
                         confidence = self._adjust_confidence_by_imbalance(
-                            base_confidence, imbalance, bullish=True, symbol=symbol
+                            base_confidence, imbalance, bullish=True, weight=imbalance_weight
                         )
                         return (
                             Pattern.REJECTION_AT_SUPPORT,
@@ -750,12 +934,12 @@ class SwingTradingStrategy(BaseStrategy):
 
         # Check resistance zones
         for level in confirmed_resistance:
-            if self.is_price_near_level(current_price, level.price, proximity_pct):
+            if abs(current_price - level.price) <= proximity:
                 # Check for absorption (breakout signal)
                 if self._is_absorbing(symbol, level, absorption_threshold):
                     confidence = self._adjust_confidence_by_imbalance(
                         level.current_volume / level.initial_volume,
-                        imbalance, bullish=False, symbol=symbol
+                        imbalance, bullish=False, weight=imbalance_weight
                     )
                     return (
                         Pattern.ABSORPTION_BREAKOUT_DOWN,
@@ -766,12 +950,12 @@ class SwingTradingStrategy(BaseStrategy):
                     )
 
                 # Check for rejection
-                if self._is_rejecting_at_resistance(current_price, level.price, symbol):
+                if self._is_rejecting_at_resistance(current_price, level.price, symbol, proximity):
                     # Check imbalance confirms the rejection
                     if imbalance < rejection_flip:  # Not heavily bullish
                         base_confidence = min(1.0, level.current_volume / 10000)
                         confidence = self._adjust_confidence_by_imbalance(
-                            base_confidence, imbalance, bullish=False, symbol=symbol
+                            base_confidence, imbalance, bullish=False, weight=imbalance_weight
                         )
                         return (
                             Pattern.REJECTION_AT_RESISTANCE,
@@ -799,13 +983,15 @@ class SwingTradingStrategy(BaseStrategy):
         current_price: float,
         symbol: str,
         analysis: Dict,
-        power_levels: List[PowerLevel]
+        power_levels: List[PowerLevel],
+        cfg: _Cfg
     ) -> Optional[tuple]:
         """
         Detect trading patterns at Power Levels with enhanced confidence.
 
         Power Levels get priority because they combine historical bounce
-        data with real-time depth confirmation.
+        data with real-time depth confirmation. power_levels come sorted by
+        combined confidence, so the first match is the strongest one.
 
         Returns:
             Tuple of (pattern, confidence, price_level, imbalance, metadata)
@@ -815,31 +1001,31 @@ class SwingTradingStrategy(BaseStrategy):
             return None
 
         imbalance = analysis['imbalance']
-        proximity_pct = self.get_config('zone_proximity_pct', 0.005, symbol=symbol)
-        confidence_boost = self.get_config('power_level_confidence_boost', 0.15, symbol=symbol)
-        rejection_flip = self.get_config('rejection_imbalance_flip', 0.60, symbol=symbol)
+        proximity = current_price * cfg.proximity_pct
+        confidence_boost = cfg.confidence_boost
+        rejection_flip = cfg.rejection_flip
 
         for pl in power_levels:
             # Skip invalid (weakened) power levels
             if not pl.is_valid:
-                instance_name = self.get_config('instance_name', self.name, symbol=symbol)
-                logger.debug(
-                    f"{instance_name} ({symbol}): Skipping weakened power level at ${pl.price:.2f}"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"{cfg.instance_name} ({symbol}): Skipping weakened power level at ${pl.price:.2f}"
+                    )
                 continue
 
             # Check if price is near this power level
-            if not self.is_price_near_level(current_price, pl.price, proximity_pct):
+            if abs(current_price - pl.price) > proximity:
                 continue
 
             # Power Level is in play - check for patterns
             if pl.level_type == 'support':
-                if self._is_bouncing_off_support(current_price, pl.price, symbol):
+                if self._is_bouncing_off_support(current_price, pl.price, symbol, proximity):
                     # Validate imbalance
                     if imbalance > -rejection_flip:  # Not heavily bearish
                         confidence = min(1.0, pl.combined_confidence + confidence_boost)
 
-                        instance_name = self.get_config('instance_name', self.name, symbol=symbol)
+                        instance_name = cfg.instance_name
                         logger.info(
                             f"{instance_name} ({symbol}): POWER LEVEL bounce at ${pl.price:.2f} "
                             f"(historical bounces: {pl.historical_level.bounce_count}, "
@@ -861,12 +1047,12 @@ class SwingTradingStrategy(BaseStrategy):
                         )
 
             elif pl.level_type == 'resistance':
-                if self._is_rejecting_at_resistance(current_price, pl.price, symbol):
+                if self._is_rejecting_at_resistance(current_price, pl.price, symbol, proximity):
                     # Validate imbalance
                     if imbalance < rejection_flip:  # Not heavily bullish
                         confidence = min(1.0, pl.combined_confidence + confidence_boost)
 
-                        instance_name = self.get_config('instance_name', self.name, symbol=symbol)
+                        instance_name = cfg.instance_name
                         logger.info(
                             f"{instance_name} ({symbol}): POWER LEVEL rejection at ${pl.price:.2f} "
                             f"(historical bounces: {pl.historical_level.bounce_count}, "
@@ -901,52 +1087,48 @@ class SwingTradingStrategy(BaseStrategy):
             return False
 
         # Check volume history for consumption pattern
-        history = self._volume_history.get(symbol, {}).get(level.price, [])
-        if len(history) < 3:
+        history = self._volume_history.get(symbol, {}).get(level.price, ())
+        n = len(history)
+        if n < 3:
             return False
 
-        # Volume should be fluctuating (being consumed and refreshed)
-        vol_variance = statistics.variance(history) if len(history) >= 2 else 0
-        avg_vol = statistics.mean(history)
+        # Volume should be fluctuating (being consumed and refreshed).
+        # Sample variance from the running sums; with whole-number sizes the
+        # numerator is exact, so this matches statistics.variance.
+        total, total_sq = self._volume_stats[symbol][level.price]
+        spread = n * total_sq - total * total
+        vol_variance = spread / (n * (n - 1)) if spread > 0 else 0
+        avg_vol = total / n
 
         # High variance relative to mean indicates absorption
         cv = (vol_variance ** 0.5) / avg_vol if avg_vol > 0 else 0
         return cv > 0.3  # Coefficient of variation > 30%
 
     def _calculate_imbalance(self, total_bid: int, total_ask: int) -> float:
-        """Calculate order book imbalance (-1 to 1)."""
-        total = total_bid + total_ask
-        if total == 0:
-            return 0.0
-        return (total_bid - total_ask) / total
+        """Calculate order book imbalance (-1 to 1); 0.0 for an empty book."""
+        # Sizes are non-negative, so a zero total means a zero numerator too
+        return (total_bid - total_ask) / ((total_bid + total_ask) or 1)
 
     def _adjust_confidence_by_imbalance(self, base_confidence: float,
-                                         imbalance: float, bullish: bool, symbol: str = None) -> float:
+                                         imbalance: float, bullish: bool, weight: float) -> float:
         """
         Adjust confidence based on whether imbalance confirms signal.
 
         Imbalance is a confidence MULTIPLIER, not an entry trigger.
+        weight is the imbalance_weight setting (from the resolved config).
         """
-        weight = self.get_config('imbalance_weight', 0.3, symbol=symbol)
-
-        if bullish:
-            adjustment = imbalance * weight
-        else:
-            adjustment = -imbalance * weight
-
-        adjusted = base_confidence + adjustment
-        return max(0.1, min(1.0, adjusted))
+        adjusted = base_confidence + imbalance * (weight if bullish else -weight)
+        return 0.1 if adjusted < 0.1 else (1.0 if adjusted > 1.0 else adjusted)
 
     def _is_bouncing_off_support(self, current_price: float,
-                                  support_level: float, symbol: str) -> bool:
-        """Detect if price is bouncing off support."""
+                                  support_level: float, symbol: str, proximity: float) -> bool:
+        """Detect if price is bouncing off support (proximity: zone proximity in dollars)."""
         previous = self.previous_price.get(symbol)
         self.previous_price[symbol] = current_price
 
         if previous is None:
             return False
 
-        proximity = self.get_proximity_distance(current_price, symbol=symbol)
         was_near = abs(previous - support_level) <= proximity
         moving_up = current_price > previous
         min_move = proximity * 0.2
@@ -955,15 +1137,14 @@ class SwingTradingStrategy(BaseStrategy):
         return was_near and moving_up and move_size >= min_move
 
     def _is_rejecting_at_resistance(self, current_price: float,
-                                     resistance_level: float, symbol: str) -> bool:
-        """Detect if price is rejecting at resistance."""
+                                     resistance_level: float, symbol: str, proximity: float) -> bool:
+        """Detect if price is rejecting at resistance (proximity: zone proximity in dollars)."""
         previous = self.previous_price.get(symbol)
         self.previous_price[symbol] = current_price
 
         if previous is None:
             return False
 
-        proximity = self.get_proximity_distance(current_price, symbol=symbol)
         was_near = abs(previous - resistance_level) <= proximity
         moving_down = current_price < previous
         min_move = proximity * 0.2
@@ -978,7 +1159,8 @@ class SwingTradingStrategy(BaseStrategy):
 
         Useful for debugging or displaying market state.
         """
-        analysis = self._analyze_book_advanced(ticker, current_price, symbol)
+        cfg = self._cfg_cache.get(symbol) or self._resolve_cfg(symbol)
+        analysis = self._analyze_book_advanced(ticker, current_price, symbol, cfg)
         confirmed_support = self._get_confirmed_levels(symbol, 'support')
         confirmed_resistance = self._get_confirmed_levels(symbol, 'resistance')
 
@@ -992,11 +1174,11 @@ class SwingTradingStrategy(BaseStrategy):
                 for z in analysis['resistance']
             ],
             'confirmed_support': [
-                {'price': l.price, 'volume': l.current_volume, 'state': l.state.value}
+                {'price': l.price, 'volume': l.current_volume, 'state': _STATE_NAMES[l.state]}
                 for l in confirmed_support
             ],
             'confirmed_resistance': [
-                {'price': l.price, 'volume': l.current_volume, 'state': l.state.value}
+                {'price': l.price, 'volume': l.current_volume, 'state': _STATE_NAMES[l.state]}
                 for l in confirmed_resistance
             ],
             'bid_depth': analysis['bid_depth_total'],
@@ -1021,25 +1203,19 @@ class SwingTradingStrategy(BaseStrategy):
         """
         Update historical bounce levels for a symbol if needed.
 
-        Checks cache TTL and fetches fresh data when stale.
+        Checks cache TTL and fetches fresh data when stale. analyze() makes
+        the same TTL check before calling, so fresh symbols cost no call.
         """
         if not self.get_config('historical_bounce_enabled', True):
             return
 
+        # Check if we need to refresh
+        if time.time() < self._historical_next_refresh.get(symbol, 0.0):
+            return  # Cache is still fresh
+
         cache_ttl = self.get_config('historical_cache_ttl_hours', 24)
-        now = datetime.now()
         now = datetime.now().astimezone()
 
-        # Check if we need to refresh
-        last_update = self._historical_last_update.get(symbol)
-        if last_update:
-            # FIX: Ensure last_update is aware
-            if last_update.tzinfo is None:
-                last_update = last_update.astimezone()
-            age_hours = (now - last_update).total_seconds() / 3600
-            if age_hours < cache_ttl:
-                return  # Cache is still fresh
-
         # Try to load from database cache first
         bars = None
         bar_size = self.get_config('historical_bar_size', '15 mins')
@@ -1047,7 +1223,11 @@ class SwingTradingStrategy(BaseStrategy):
         if self._trade_db:
             cached = self._trade_db.get_cached_bars(symbol, bar_size, cache_ttl)
             if cached:
-                bars = cached
+                bars = _BarColumns(
+                    timestamps=[bar['timestamp'] for bar in cached],
+                    highs=[bar['high'] for bar in cached],
+                    lows=[bar['low'] for bar in cached],
+                )
                 logger.debug(f"{self.get_config('instance_name', self.name, symbol=config_symbol)}: Using cached bars for {symbol}")
 
         # Fetch from IB if no cache
@@ -1060,24 +1240,22 @@ class SwingTradingStrategy(BaseStrategy):
             )
 
             if ib_bars:
-                # Convert to dict format and cache
-                bars = [
-                    {
-                        'timestamp': bar.date if isinstance(bar.date, datetime) else datetime.fromisoformat(str(bar.date)),
-                        'open': bar.open,
-                        'high': bar.high,
-                        'low': bar.low,
-                        'close': bar.close,
-                        'volume': bar.volume,
-                    }
-                    for bar in ib_bars
-                ]
+                # Convert to columns and cache
+                bars = _BarColumns(
+                    timestamps=[
+                        bar.date if isinstance(bar.date, datetime) else datetime.fromisoformat(str(bar.date))
+                        for bar in ib_bars
+                    ],
+                    highs=[bar.high for bar in ib_bars],
+                    lows=[bar.low for bar in ib_bars],
+                )
 
                 if self._trade_db:
                     self._trade_db.cache_historical_bars(symbol, bar_size, ib_bars)
 
-        if not bars:
-            logger.debug(f"{self.get_config('instance_name', self.name, symbol=config_symbol)}: No historical bars for {symbol}")
+        if bars is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{self.get_config('instance_name', self.name, symbol=config_symbol)}: No historical bars for {symbol}")
             return
 
         # Identify swing points and bounce levels
@@ -1085,14 +1263,21 @@ class SwingTradingStrategy(BaseStrategy):
         bounce_levels = self._identify_bounce_levels(swing_points, current_price, symbol=config_symbol)
 
         # Apply decay to all levels
-        for level in bounce_levels:
-            level.decayed_strength = self._apply_decay(level, now, symbol=config_symbol)
+        self._apply_decay(bounce_levels, now, symbol=config_symbol)
 
         # Sort by decayed strength and limit
-        bounce_levels.sort(key=lambda l: l.decayed_strength, reverse=True)
+        bounce_levels.sort(key=_BY_DECAYED_STRENGTH, reverse=True)
         max_levels = self.get_config('max_historical_levels', 10)
-        self._historical_levels[symbol] = bounce_levels[:max_levels]
-        self._historical_last_update[symbol] = now
+        self._historical_levels[symbol] = bounce_levels = bounce_levels[:max_levels]
+        # Per-type price index for matching against depth levels on every tick
+        index = {}
+        for level_type in ('support', 'resistance'):
+            ordered = sorted((level.price, i) for i, level in enumerate(bounce_levels)
+                             if level.level_type == level_type)
+            index[level_type] = ([price for price, _ in ordered], [i for _, i in ordered])
+        self._historical_index[symbol] = index
+        # Only a successful refresh starts the TTL; failures retry on the next tick
+        self._historical_next_refresh[symbol] = now.timestamp() + cache_ttl * 3600
 
         instance_name = self.get_config('instance_name', self.name, symbol=config_symbol)
         if bounce_levels:
@@ -1101,7 +1286,7 @@ class SwingTradingStrategy(BaseStrategy):
                 f"from {len(swing_points)} swing points"
             )
 
-    def _identify_swing_points(self, bars: List[Dict], symbol: str = None) -> List[SwingPoint]:
+    def _identify_swing_points(self, bars: _BarColumns, symbol: str = None) -> List[SwingPoint]:
         """
         Identify swing highs and lows using a local extremum window.
 
@@ -1115,39 +1300,38 @@ class SwingTradingStrategy(BaseStrategy):
         window = self.get_config('swing_window', 5, symbol=symbol)
         half_window = window // 2
 
-        if len(bars) < window:
+        highs, lows, timestamps = bars.highs, bars.lows, bars.timestamps
+        n = len(highs)
+        if n < window:
             return []
 
-        for i in range(half_window, len(bars) - half_window):
-            current_bar = bars[i]
-
-            # Check for swing high
-            is_swing_high = True
-            for j in range(i - half_window, i + half_window + 1):
-                if j != i and bars[j]['high'] >= current_bar['high']:
-                    is_swing_high = False
-                    break
-
-            if is_swing_high:
+        # Run the window scan over the price columns (compiled when Numba is available)
+        if NUMBA_AVAILABLE:
+            flags = np.zeros(n, dtype=np.int8)
+            swing_scan(np.array(highs, dtype=np.float64), np.array(lows, dtype=np.float64),
+                       half_window, flags)
+            # Only the flagged bars, in bar order
+            flagged = np.flatnonzero(flags).tolist()
+        else:
+            flags = [0] * n
+            swing_scan(highs, lows, half_window, flags)
+            flagged = [i for i, flag in enumerate(flags) if flag]
+
+        # Swing times are aware UTC (naive bar times are local time), so decay
+        # can subtract them without checking timezones per level
+        for i in flagged:
+            flag = flags[i]
+            if flag == 1:
                 swing_points.append(SwingPoint(
-                    price=current_bar['high'],
-                    timestamp=current_bar['timestamp'],
+                    price=highs[i],
+                    timestamp=timestamps[i].astimezone(timezone.utc),
                     swing_type='high',
                     bar_index=i
                 ))
-                continue  # A bar can't be both swing high and low
-
-            # Check for swing low
-            is_swing_low = True
-            for j in range(i - half_window, i + half_window + 1):
-                if j != i and bars[j]['low'] <= current_bar['low']:
-                    is_swing_low = False
-                    break
-
-            if is_swing_low:
+            elif flag == -1:
                 swing_points.append(SwingPoint(
-                    price=current_bar['low'],
-                    timestamp=current_bar['timestamp'],
+                    price=lows[i],
+                    timestamp=timestamps[i].astimezone(timezone.utc),
                     swing_type='low',
                     bar_index=i
                 ))
@@ -1196,40 +1380,49 @@ class SwingTradingStrategy(BaseStrategy):
             return []
 
         # Sort by price
-        sorted_points = sorted(points, key=lambda p: p.price)
+        sorted_points = sorted(points, key=_BY_PRICE)
+
+        prices = [p.price for p in sorted_points]
 
-        clusters: List[List[SwingPoint]] = []
-        current_cluster = [sorted_points[0]]
+        # Clusters are contiguous runs of the sorted points, so track each as
+        # (start, end, price sum) and only slice out the ones that are kept;
+        # the running sum keeps the average O(1)
+        clusters: List[tuple] = []
+        start = 0
+        cluster_sum = prices[0]
 
-        for point in sorted_points[1:]:
-            cluster_avg = sum(p.price for p in current_cluster) / len(current_cluster)
+        for i in range(1, len(prices)):
+            price = prices[i]
+            cluster_avg = cluster_sum / (i - start)
 
             # Check if within proximity (using current price as reference)
-            if abs(point.price - cluster_avg) / current_price <= proximity_pct:
-                current_cluster.append(point)
+            if abs(price - cluster_avg) / current_price <= proximity_pct:
+                cluster_sum += price
             else:
                 # Start new cluster
-                if len(current_cluster) >= min_bounces:
-                    clusters.append(current_cluster)
-                current_cluster = [point]
+                if i - start >= min_bounces:
+                    clusters.append((start, i, cluster_sum))
+                start = i
+                cluster_sum = price
 
         # Don't forget the last cluster
-        if len(current_cluster) >= min_bounces:
-            clusters.append(current_cluster)
+        if len(prices) - start >= min_bounces:
+            clusters.append((start, len(prices), cluster_sum))
 
         # Convert clusters to HistoricalBounceLevel objects
         levels = []
-        for cluster in clusters:
-            avg_price = sum(p.price for p in cluster) / len(cluster)
-            timestamps = sorted([p.timestamp for p in cluster])
+        for start, end, cluster_sum in clusters:
+            count = end - start
+            # One pass over the members; the price sum came from the sweep
+            timestamps = sorted([p.timestamp for p in sorted_points[start:end]])
 
             # Strength based on bounce count (5+ bounces = max strength of 1.0)
-            strength = min(1.0, len(cluster) / 5.0)
+            strength = min(1.0, count / 5.0)
 
             levels.append(HistoricalBounceLevel(
-                price=avg_price,
+                price=cluster_sum / count,
                 level_type=level_type,
-                bounce_count=len(cluster),
+                bounce_count=count,
                 first_test=timestamps[0],
                 last_test=timestamps[-1],
                 bounce_timestamps=timestamps,
@@ -1239,68 +1432,55 @@ class SwingTradingStrategy(BaseStrategy):
 
         return levels
 
-    def _apply_decay(self, level: HistoricalBounceLevel,
-                     current_time: Optional[datetime] = None, symbol: str = None) -> float:
+    def _apply_decay(self, levels: List[HistoricalBounceLevel],
+                     current_time: Optional[datetime] = None, symbol: str = None):
         """
-        Apply time decay to a historical level.
+        Apply time decay to historical levels, setting decayed_strength.
 
-        Supports linear or exponential decay based on config.
+        Supports linear or exponential decay based on config. The decay
+        settings are read once for the whole batch rather than per level.
+        Level times are aware (see _identify_swing_points), and so must
+        current_time be.
         """
-        current_time = current_time or datetime.now()
+        current_time = current_time or datetime.now(timezone.utc)
         decay_type = self.get_config('decay_type', 'linear', symbol=symbol)
 
         if decay_type == 'exponential':
-            return self._apply_exponential_decay(level, current_time, symbol=symbol)
+            half_life_days = self.get_config('exponential_half_life_days', 15.0, symbol=symbol)
+            decay_rate = math.log(2) / half_life_days  # per day
+            for level in levels:
+                level.decayed_strength = self._apply_exponential_decay(level, current_time, decay_rate)
         else:
-            return self._apply_linear_decay(level, current_time, symbol=symbol)
+            decay_days = self.get_config('linear_decay_days', 30, symbol=symbol)
+            for level in levels:
+                level.decayed_strength = self._apply_linear_decay(level, current_time, decay_days)
 
     def _apply_linear_decay(self, level: HistoricalBounceLevel,
-                            current_time: datetime, symbol: str = None) -> float:
+                            current_time: datetime, decay_days: float) -> float:
         """
         Apply linear time decay to a historical level.
 
         Formula: decayed_strength = base_strength * (1 - age_days / decay_days)
         """
-        decay_days = self.get_config('linear_decay_days', 30, symbol=symbol)
-
         # Use most recent test for decay calculation
-        last_test = level.last_test
-
-        # Normalize timezones for subtraction
-        if last_test.tzinfo is not None and current_time.tzinfo is None:
-            current_time = current_time.astimezone()
-        elif last_test.tzinfo is None and current_time.tzinfo is not None:
-            last_test = last_test.astimezone()
-
-        age = current_time - last_test
+        age = current_time - level.last_test
         age_days = age.total_seconds() / 86400
 
         decay_factor = max(0.0, 1.0 - (age_days / decay_days))
         return level.strength * decay_factor
 
     def _apply_exponential_decay(self, level: HistoricalBounceLevel,
-                                  current_time: datetime, symbol: str = None) -> float:
+                                  current_time: datetime, decay_rate: float) -> float:
         """
         Apply exponential time decay to a historical level.
 
-        Formula: decayed_strength = base_strength * 2^(-age_days / half_life_days)
+        Formula: decayed_strength = base_strength * 2^(-age_days / half_life_days),
+        computed as exp(-age_days * decay_rate) with decay_rate = ln(2) / half_life_days.
         """
-        import math
-
-        half_life_days = self.get_config('exponential_half_life_days', 15.0, symbol=symbol)
-
-        last_test = level.last_test
-
-        # Normalize timezones for subtraction
-        if last_test.tzinfo is not None and current_time.tzinfo is None:
-            current_time = current_time.astimezone()
-        elif last_test.tzinfo is None and current_time.tzinfo is not None:
-            last_test = last_test.astimezone()
-
-        age = current_time - last_test
+        age = current_time - level.last_test
         age_days = age.total_seconds() / 86400
 
-        decay_factor = math.pow(2, -age_days / half_life_days)
+        decay_factor = math.exp(-age_days * decay_rate)
         return level.strength * decay_factor
 
     def _detect_power_levels(self, symbol: str,
@@ -1319,39 +1499,58 @@ class SwingTradingStrategy(BaseStrategy):
         power_levels = []
         proximity_pct = self.get_config('power_level_proximity_pct', 0.005, symbol=symbol)
 
-        for hist_level in historical_levels:
-            for depth_level in depth_levels:
-                # Skip if types don't match
-                if hist_level.level_type != depth_level.zone_type:
-                    continue
-
-                # Check proximity using percentage of current price
-                proximity = abs(hist_level.price - depth_level.price) / current_price
+        # (historical, depth) pairs of the same type whose prices are within
+        # proximity_pct of current price of each other, historical-major order.
+        # Each depth level bisects the sorted historical prices of its type;
+        # the window is a hair wider than the tolerance so the distance test
+        # below decides pairs right at the boundary.
+        index = self._historical_index[symbol]
+        tolerance = proximity_pct * current_price
+        window = tolerance * (1 + 1e-9)
+        matches = []
+        for d, depth_level in enumerate(depth_levels):
+            entry = index.get(depth_level.zone_type)
+            if entry is None:
+                continue
+            hist_prices, hist_indices = entry
+            price = depth_level.price
+            lo = bisect_left(hist_prices, price - window)
+            hi = bisect_right(hist_prices, price + window, lo)
+            for h in hist_indices[lo:hi]:
+                if abs(historical_levels[h].price - price) <= tolerance:
+                    matches.append((h, d))
+        matches.sort()
+        pairs = [(historical_levels[h], depth_levels[d]) for h, d in matches]
+
+        # The tracked levels don't change while pairing, so average them once
+        avg_depth = self._get_average_depth_volume(symbol) if pairs else 0.0
+
+        for hist_level, depth_level in pairs:
+            # Calculate depth strength relative to average
+            depth_strength = self._categorize_depth_strength(symbol,
+                depth_level.current_volume, avg_depth
+            )
 
-                if proximity <= proximity_pct:
-                    # Calculate depth strength relative to average
-                    avg_depth = self._get_average_depth_volume(symbol)
-                    depth_strength = self._categorize_depth_strength(symbol,
-                        depth_level.current_volume, avg_depth
-                    )
+            # Determine if valid (not weakened)
+            is_valid = depth_strength != 'weak'
 
-                    # Determine if valid (not weakened)
-                    is_valid = depth_strength != 'weak'
+            # Calculate combined confidence
+            combined_confidence = self._calculate_power_level_confidence(
+                hist_level, depth_level, depth_strength
+            )
 
-                    # Calculate combined confidence
-                    combined_confidence = self._calculate_power_level_confidence(
-                        hist_level, depth_level, depth_strength
-                    )
+            power_levels.append(PowerLevel(
+                price=(hist_level.price + depth_level.price) / 2,
+                level_type=hist_level.level_type,
+                historical_level=hist_level,
+                depth_level=depth_level,
+                combined_confidence=combined_confidence,
+                depth_strength=depth_strength,
+                is_valid=is_valid,
+            ))
 
-                    power_levels.append(PowerLevel(
-                        price=(hist_level.price + depth_level.price) / 2,
-                        level_type=hist_level.level_type,
-                        historical_level=hist_level,
-                        depth_level=depth_level,
-                        combined_confidence=combined_confidence,
-                        depth_strength=depth_strength,
-                        is_valid=is_valid,
-                    ))
+        # Strongest first, so pattern detection acts on the best level in play
+        power_levels.sort(key=_BY_COMBINED_CONFIDENCE, reverse=True)
 
         # Store for later use
         self._power_levels[symbol] = power_levels
@@ -1363,8 +1562,7 @@ class SwingTradingStrategy(BaseStrategy):
         if not tracked:
             return 10000  # Default fallback
 
-        volumes = [level.current_volume for level in tracked.values()]
-        return sum(volumes) / len(volumes) if volumes else 10000
+        return sum(level.current_volume for level in tracked.values()) / len(tracked)
 
     def _categorize_depth_strength(self, symbol: str, volume: int, average_volume: float) -> str:
         """
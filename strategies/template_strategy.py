@@ -6,7 +6,7 @@ Copy this file and modify it to create your own strategy.
 
 To use your strategy:
 1. Copy this file to strategies/my_strategy.py
-2. Rename the class to MyStrategy
+2. Rename the class to MyStrategy and update @register_strategy('my_strategy')
 3. Implement the analyze() method with your trading logic
 4. Add configuration to config.yaml under strategies.my_strategy
 """
@@ -14,11 +14,12 @@ To use your strategy:
 import logging
 from typing import Dict, Optional, Any
 
-from .base_strategy import BaseStrategy, StrategySignal, TradeDirection
+from .base_strategy import BaseStrategy, StrategySignal, TradeDirection, register_strategy
 
 logger = logging.getLogger(__name__)
 
 
+@register_strategy('template_strategy')
 class TemplateStrategy(BaseStrategy):
     """
     Template strategy - copy and modify this for your own strategies.
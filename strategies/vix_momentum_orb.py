@@ -9,11 +9,12 @@ from datetime import datetime, time, timedelta
 from typing import Dict, Optional, Any, List, Tuple
 from zoneinfo import ZoneInfo
 
-from .base_strategy import BaseStrategy, StrategySignal, TradeDirection
+from .base_strategy import BaseStrategy, StrategySignal, TradeDirection, register_strategy
 
 logger = logging.getLogger(__name__)
 
 
+@register_strategy('vix_momentum_orb')
 class VIXMomentumORB(BaseStrategy):
     """
     VIX Momentum ORB Strategy.
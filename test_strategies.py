@@ -13,7 +13,7 @@ from typing import Dict, Any
 # Import the generator and strategies
 from test_data_generator import MarketDataGenerator
 try:
-    from strategies import SwingTradingStrategy
+    from strategies import SwingTradingStrategy, StrategyManager
     from strategies.template_strategy import TemplateStrategy
     from strategies.vix_momentum_orb import VIXMomentumORB
     from strategies.base_strategy import TradeDirection
@@ -190,5 +190,56 @@ class TestSwingTradingStrategy(unittest.TestCase):
         """Run self-defined scenarios for VIXMomentumORB."""
         self.run_strategy_scenarios(VIXMomentumORB)
 
+class TestStrategyManager(unittest.TestCase):
+    """Tests for strategy loading and orchestration."""
+
+    def test_load_from_file_reuses_cached_module(self):
+        """Loading the same plugin file twice executes it only once."""
+        manager = StrategyManager()
+        first = manager.load_strategy('template_a', strategy_type='template_strategy')
+        second = manager.load_strategy('template_b', strategy_type='template_strategy')
+
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertIsNot(first, second)
+        self.assertIs(type(first), type(second))
+        self.assertEqual(first.get_config('instance_name'), 'template_a')
+
+    def test_reload_strategy_reexecutes_cached_file(self):
+        """An explicit reload bypasses the import cache."""
+        manager = StrategyManager()
+        original = manager.load_strategy('template_a', strategy_type='template_strategy')
+
+        self.assertTrue(manager.reload_strategy('template_a'))
+        reloaded = manager.get_strategy('template_a')
+        self.assertIsNot(type(reloaded), type(original))
+
+    def test_reload_all_skips_unchanged_files(self):
+        """reload_all() only reloads strategies whose file changed, unless forced."""
+        manager = StrategyManager()
+        original = manager.load_strategy('template_a', strategy_type='template_strategy')
+
+        self.assertEqual(manager.reload_all(), {'template_a': True})
+        self.assertIs(manager.get_strategy('template_a'), original)
+
+        self.assertEqual(manager.reload_all(force=True), {'template_a': True})
+        self.assertIsNot(manager.get_strategy('template_a'), original)
+
+    def test_disabled_builtin_is_created_on_enable(self):
+        """A disabled built-in strategy is only instantiated once enabled."""
+        manager = StrategyManager()
+        placeholder = manager.load_strategy('swing_off', strategy_type='swing_trading',
+                                            config={'enabled': False, 'min_confidence': 0.9})
+        self.assertNotIsInstance(placeholder, SwingTradingStrategy)
+        self.assertEqual(placeholder.get_config('min_confidence'), 0.9)
+        db = object()
+        placeholder.set_trade_db(db)
+
+        manager.enable_strategy('swing_off')
+        strategy = manager.get_strategy('swing_off')
+        self.assertIsInstance(strategy, SwingTradingStrategy)
+        self.assertTrue(manager.is_enabled('swing_off'))
+        self.assertIs(strategy._trade_db, db)
+
 if __name__ == '__main__':
     unittest.main()
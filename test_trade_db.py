@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the historical bar cache in TradeDatabase.
+
+Run with: python test_trade_db.py
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from trade_db import TradeDatabase
+
+
+def make_bar(date, price=100.0, volume=1000):
+    """Stand-in for an ib_insync BarData."""
+    return SimpleNamespace(date=date, open=price, high=price + 1, low=price - 1,
+                           close=price, volume=volume)
+
+
+class TestHistoricalBarCache(unittest.TestCase):
+
+    def setUp(self):
+        self.db = TradeDatabase(':memory:')
+        self.start = datetime(2026, 1, 5, 9, 30)
+
+    def tearDown(self):
+        self.db.conn.close()
+
+    def test_duplicate_timestamp_keeps_first_bar(self):
+        bars = [
+            make_bar(self.start, price=100.0),
+            make_bar(self.start, price=200.0),
+            make_bar(self.start + timedelta(minutes=15), price=101.0),
+        ]
+
+        count = self.db.cache_historical_bars('TEST', '15 mins', bars)
+
+        self.assertEqual(count, 2)
+        self.assertFalse(self.db.conn.in_transaction)
+        cached = self.db.get_cached_bars('TEST', '15 mins')
+        self.assertEqual([bar['open'] for bar in cached], [100.0, 101.0])
+
+    def test_unstorable_bar_is_skipped(self):
+        bars = [make_bar(self.start + timedelta(minutes=15 * i)) for i in range(3)]
+        bars[1].volume = object()  # SQLite can't bind this
+
+        count = self.db.cache_historical_bars('TEST', '15 mins', bars)
+
+        self.assertEqual(count, 2)
+        self.assertFalse(self.db.conn.in_transaction)
+        self.assertEqual(len(self.db.get_cached_bars('TEST', '15 mins')), 2)
+
+    def test_recache_replaces_previous_bars(self):
+        self.db.cache_historical_bars('TEST', '15 mins', [make_bar(self.start)])
+        later = [make_bar(self.start + timedelta(days=1, minutes=15 * i)) for i in range(2)]
+
+        self.assertEqual(self.db.cache_historical_bars('TEST', '15 mins', later), 2)
+        cached = self.db.get_cached_bars('TEST', '15 mins')
+        self.assertEqual([bar['timestamp'] for bar in cached], [bar.date for bar in later])
+
+
+if __name__ == '__main__':
+    unittest.main()
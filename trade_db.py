@@ -789,27 +789,51 @@ class TradeDatabase:
         if not bars:
             return 0
 
-        # Delete existing bars for this symbol/bar_size
-        self.conn.execute(
-            "DELETE FROM historical_bars WHERE symbol = ? AND bar_size = ?",
-            (symbol, bar_size)
-        )
-
-        # Insert new bars
-        count = 0
+        # Build the rows, then insert them in one executemany call
+        rows = []
         for bar in bars:
             try:
                 # BarData.date can be datetime or date object
                 timestamp = bar.date.isoformat() if hasattr(bar.date, 'isoformat') else str(bar.date)
-                self.conn.execute("""
-                    INSERT INTO historical_bars (symbol, bar_size, timestamp, open, high, low, close, volume)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (symbol, bar_size, timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume))
-                count += 1
+                rows.append((symbol, bar_size, timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume))
             except Exception as e:
                 logger.warning(f"Error caching bar for {symbol}: {e}")
 
-        self.conn.commit()
+        delete_sql = "DELETE FROM historical_bars WHERE symbol = ? AND bar_size = ?"
+        # Duplicate timestamps keep the first bar (UNIQUE(symbol, bar_size, timestamp))
+        insert_sql = """
+            INSERT OR IGNORE INTO historical_bars (symbol, bar_size, timestamp, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+        try:
+            # Delete existing bars for this symbol/bar_size
+            self.conn.execute(delete_sql, (symbol, bar_size))
+            try:
+                count = self.conn.executemany(insert_sql, rows).rowcount
+                skipped = len(rows) - count
+            except sqlite3.Error as e:
+                # One bar SQLite can't store fails the whole batch; redo it bar by bar
+                self.conn.rollback()
+                logger.warning(f"Batch caching of bars for {symbol} failed ({e}), retrying per bar")
+                self.conn.execute(delete_sql, (symbol, bar_size))
+                count = skipped = 0
+                for row in rows:
+                    try:
+                        inserted = self.conn.execute(insert_sql, row).rowcount
+                    except sqlite3.Error as e:
+                        logger.warning(f"Error caching bar for {symbol}: {e}")
+                        continue
+                    count += inserted
+                    skipped += 1 - inserted
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Error caching historical bars for {symbol}: {e}")
+            return 0
+
+        if skipped:
+            logger.warning(f"Skipped {skipped} duplicate historical bars for {symbol} ({bar_size})")
         logger.info(f"Cached {count} historical bars for {symbol} ({bar_size})")
         return count
 
@@ -854,16 +878,18 @@ class TradeDatabase:
             ORDER BY timestamp ASC
         """, (symbol, bar_size))
 
-        bars = []
-        for row in cursor.fetchall():
-            bars.append({
-                'timestamp': datetime.fromisoformat(row['timestamp']),
-                'open': row['open'],
-                'high': row['high'],
-                'low': row['low'],
-                'close': row['close'],
-                'volume': row['volume'],
-            })
+        fromisoformat = datetime.fromisoformat
+        bars = [
+            {
+                'timestamp': fromisoformat(timestamp),
+                'open': bar_open,
+                'high': high,
+                'low': low,
+                'close': close,
+                'volume': volume,
+            }
+            for timestamp, bar_open, high, low, close, volume in cursor.fetchall()
+        ]
 
         if bars:
             logger.debug(f"Retrieved {len(bars)} cached bars for {symbol} ({bar_size})")